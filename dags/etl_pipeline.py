@@ -2,18 +2,89 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
 from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
 
 from airflow import DAG
+from airflow.models.baseoperator import chain, cross_downstream
 from airflow.operators.python import PythonOperator
 
+DIMENSION_TABLES = ["dim_host", "dim_listing", "dim_neighborhood", "dim_property_type", "dim_date"]
+# dim_listing references these dimensions, and the snapshot loads TRUNCATE ... CASCADE into
+# it, so it must only load once they have finished.
+LISTING_PARENT_TABLES = ["dim_host", "dim_property_type", "dim_neighborhood"]
+# Each snapshot load starts with TRUNCATE ... CASCADE; run them one after another so
+# concurrent truncates never contend for (or empty) the same dependent tables.
+SNAPSHOT_TABLES = ["dim_neighborhood", "dim_property_type", "dim_date"]
+FACT_TABLES = ["fact_listing_daily_metrics", "fact_review"]
 
-def _run_orchestrator() -> None:
-    """Invoke the Python orchestrator entrypoint."""
+# Dimension loads are small and run side by side; fact COPYs move the bulk of the data,
+# so they can be throttled separately to bound concurrent Postgres connections.
+DIMENSION_LOAD_POOL = os.getenv("AIRFLOW_DIMENSION_LOAD_POOL", "default_pool")
+FACT_LOAD_POOL = os.getenv("AIRFLOW_FACT_LOAD_POOL", "default_pool")
 
-    from src.pipeline.orchestrator import run_pipeline
 
-    run_pipeline()
+def _flushing_logs(task: Callable[..., Any]) -> Callable[..., Any]:
+    """Drain the pipeline's queued log records before Airflow's task runner ``os._exit``s."""
+
+    @functools.wraps(task)
+    def _run(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return task(*args, **kwargs)
+        finally:
+            from src.utils.logger import shutdown_logging
+
+            shutdown_logging()
+
+    return _run
+
+
+@_flushing_logs
+def _extract() -> None:
+    """Extract and validate the raw sources, warming the Parquet cache for the transform task."""
+
+    from src.pipeline.extract import extract_sources
+    from src.pipeline.validate import validate_dataframes
+
+    validate_dataframes(extract_sources().dataframes)
+
+
+@_flushing_logs
+def _transform(**context: Any) -> Dict[str, str]:
+    """
+    Transform the cached sources and return the Parquet path of every output table.
+
+    Intermediates go to a directory per DAG run, so overlapping runs never overwrite
+    each other's Parquet files.
+    """
+
+    from pathlib import Path
+
+    from src.pipeline.extract import extract_sources
+    from src.pipeline.transform import transform_datasets
+    from src.utils.db_connector import load_pipeline_config
+
+    output_dir = Path(load_pipeline_config().get("paths", {}).get("output_dir", "output"))
+    run_dir = output_dir / "intermediate" / re.sub(r"[^\w.-]", "_", context["run_id"])
+    transformation = transform_datasets(extract_sources(), output_dir=run_dir)
+    outputs = {**transformation.dimensions, **transformation.facts}
+    return {table_name: str(path) for table_name, path in outputs.items()}
+
+
+@_flushing_logs
+def _load(table_name: str, **context: Any) -> None:
+    """Load one warehouse table from the Parquet file produced by the transform task."""
+
+    from pathlib import Path
+
+    from src.pipeline.load import load_table
+    from src.utils.db_connector import DBConnector
+
+    paths = context["ti"].xcom_pull(task_ids="transform")
+    load_table(DBConnector(), table_name, Path(paths[table_name]))
 
 
 default_args = {
@@ -31,11 +102,40 @@ with DAG(
     start_date=datetime(2024, 1, 1),
     schedule_interval="@daily",
     catchup=False,
+    max_active_runs=1,
     tags=["airbnb", "etl", "analytics"],
 ) as dag:
-    run_full_pipeline = PythonOperator(
-        task_id="run_orchestrator_pipeline",
-        python_callable=_run_orchestrator,
+    extract = PythonOperator(
+        task_id="extract",
+        python_callable=_extract,
+    )
+
+    transform = PythonOperator(
+        task_id="transform",
+        python_callable=_transform,
     )
 
-    run_full_pipeline
+    load_dimensions = {
+        table_name: PythonOperator(
+            task_id=f"load_{table_name}",
+            python_callable=_load,
+            op_kwargs={"table_name": table_name},
+            pool=DIMENSION_LOAD_POOL,
+        )
+        for table_name in DIMENSION_TABLES
+    }
+
+    load_facts = [
+        PythonOperator(
+            task_id=f"load_{table_name}",
+            python_callable=_load,
+            op_kwargs={"table_name": table_name},
+            pool=FACT_LOAD_POOL,
+        )
+        for table_name in FACT_TABLES
+    ]
+
+    extract >> transform >> list(load_dimensions.values())
+    chain(*(load_dimensions[table_name] for table_name in SNAPSHOT_TABLES))
+    [load_dimensions[table_name] for table_name in LISTING_PARENT_TABLES] >> load_dimensions["dim_listing"]
+    cross_downstream(list(load_dimensions.values()), load_facts)
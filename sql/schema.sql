@@ -110,7 +110,7 @@ CREATE TABLE IF NOT EXISTS dim_listing (
     bathrooms              NUMERIC(4,2),
     bedrooms               NUMERIC(4,2),
     beds                   NUMERIC(4,2),
-    amenities_hash         TEXT,
+    amenities_hash         BIGINT, -- 64-bit hash of the normalized amenities list
     cancellation_policy    TEXT,
     minimum_nights         INTEGER,
     maximum_nights         INTEGER,
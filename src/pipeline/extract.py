@@ -3,17 +3,27 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import parquet as pq
 
 from src.utils.db_connector import load_pipeline_config
 from src.utils.logger import get_logger
 
 LOGGER = get_logger(__name__)
 
+CSV_BLOCK_SIZE = 64 << 20
+DEFAULT_CHUNK_SIZE = 100_000
+CACHE_DIR_NAME = ".cache"
+CACHE_ROW_GROUP_SIZE = 256_000
+MAX_EXTRACT_WORKERS = 8
+
 
 @dataclass
 class ExtractionResult:
@@ -23,12 +33,64 @@ class ExtractionResult:
     metadata: Dict[str, Dict[str, Any]]
 
 
-def _read_source(
-    name: str,
-    source_cfg: Dict[str, Any],
-    base_dir: Path,
-    limit: Optional[int] = None,
-) -> ExtractionResult:
+def _column_types(source_cfg: Dict[str, Any]) -> Dict[str, pa.DataType]:
+    column_types: Dict[str, pa.DataType] = {}
+    if source_cfg.get("primary_key"):
+        column_types[source_cfg["primary_key"]] = pa.int64()
+    if source_cfg.get("date_column"):
+        column_types[source_cfg["date_column"]] = pa.timestamp("ms")
+    return column_types
+
+
+def _convert_options(source_cfg: Optional[Dict[str, Any]]) -> pa_csv.ConvertOptions:
+    return pa_csv.ConvertOptions(
+        column_types=_column_types(source_cfg) if source_cfg else None,
+        strings_can_be_null=True,
+    )
+
+
+def _read_csv_table(file_path: Path, source_cfg: Dict[str, Any]) -> pa.Table:
+    """
+    Parse a whole CSV with Arrow's multi-threaded reader, typing key/date columns upfront.
+
+    The whole file is always parsed: the streaming reader infers types from its first block
+    only, so a value that changes a column's type further down would abort a partial read,
+    and partial reads would otherwise disagree with full reads on dtypes.
+    """
+
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    try:
+        return pa_csv.read_csv(file_path, read_options=read_options, convert_options=_convert_options(source_cfg))
+    except pa.ArrowInvalid as exc:
+        # Malformed keys/dates must not abort extraction; let validation report them instead.
+        LOGGER.warning("Typed CSV parse failed for %s (%s); falling back to inferred types", file_path, exc)
+        return pa_csv.read_csv(file_path, read_options=read_options, convert_options=_convert_options(None))
+
+
+def _rebatch(batches: Iterable[pa.RecordBatch], chunksize: int) -> Iterator[pa.Table]:
+    buffer: List[pa.RecordBatch] = []
+    buffered = 0
+    for batch in batches:
+        buffer.append(batch)
+        buffered += batch.num_rows
+        while buffered >= chunksize:
+            table = pa.Table.from_batches(buffer)
+            yield table.slice(0, chunksize)
+            remainder = table.slice(chunksize)
+            buffer = remainder.to_batches()
+            buffered = remainder.num_rows
+    if buffered:
+        yield pa.Table.from_batches(buffer)
+
+
+def _to_dataframe(table: pa.Table, date_col: Optional[str]) -> pd.DataFrame:
+    df = table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+    if date_col and date_col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+    return df
+
+
+def _source_file_path(name: str, source_cfg: Dict[str, Any], base_dir: Path) -> Path:
     file_name = source_cfg.get("file")
     if not file_name:
         raise ValueError(f"Source `{name}` is missing the `file` attribute in config.yaml.")
@@ -36,18 +98,84 @@ def _read_source(
     file_path = base_dir / file_name
     if not file_path.exists():
         raise FileNotFoundError(f"Source `{name}` file not found: {file_path}")
+    return file_path
 
-    date_col = source_cfg.get("date_column")
 
+def _cache_path(name: str, base_dir: Path) -> Path:
+    return base_dir / CACHE_DIR_NAME / f"{name}.parquet"
+
+
+def _is_cache_fresh(cache_path: Path, file_path: Path) -> bool:
+    return cache_path.exists() and cache_path.stat().st_mtime >= file_path.stat().st_mtime
+
+
+def _write_cache(table: pa.Table, cache_path: Path) -> None:
+    """Persist the parsed source as Parquet so later runs skip the CSV parse."""
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            table,
+            tmp_path,
+            compression="zstd",
+            use_dictionary=True,
+            row_group_size=CACHE_ROW_GROUP_SIZE,
+        )
+        tmp_path.replace(cache_path)
+    except OSError as exc:
+        LOGGER.warning("Could not write Parquet cache %s: %s", cache_path, exc)
+
+
+def _read_cache(cache_path: Path, limit: Optional[int] = None) -> pa.Table:
+    if not limit:
+        return pq.read_table(cache_path, memory_map=True)
+    # Decode only the leading batches that cover ``limit`` rows.
+    parquet_file = pq.ParquetFile(cache_path, memory_map=True)
+    batches: List[pa.RecordBatch] = []
+    row_count = 0
+    for batch in parquet_file.iter_batches(batch_size=min(limit, CACHE_ROW_GROUP_SIZE)):
+        batches.append(batch)
+        row_count += batch.num_rows
+        if row_count >= limit:
+            break
+    return pa.Table.from_batches(batches, schema=parquet_file.schema_arrow).slice(0, limit)
+
+
+def _parse_and_cache(name: str, source_cfg: Dict[str, Any], file_path: Path, cache_path: Path) -> pa.Table:
     LOGGER.info("Reading source `%s` from %s", name, file_path)
-    df = pd.read_csv(file_path)
-    if date_col and date_col in df.columns:
-        df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-    if limit:
-        df = df.head(limit)
+    table = _read_csv_table(file_path, source_cfg)
+    _write_cache(table, cache_path)
+    return table
+
+
+def _read_source(
+    name: str,
+    source_cfg: Dict[str, Any],
+    base_dir: Path,
+    limit: Optional[int] = None,
+) -> ExtractionResult:
+    file_path = _source_file_path(name, source_cfg, base_dir)
+    date_col = source_cfg.get("date_column")
+
+    cache_path = _cache_path(name, base_dir)
+    cache_hit = _is_cache_fresh(cache_path, file_path)
+    if cache_hit:
+        LOGGER.info("Reading source `%s` from Parquet cache %s", name, cache_path)
+        table = _read_cache(cache_path, limit)
+    else:
+        # Without a cache even a limited read parses the whole file once, so its dtypes match
+        # full runs; the cache it writes lets later limited reads stop early.
+        table = _parse_and_cache(name, source_cfg, file_path, cache_path)
+        if limit:
+            table = table.slice(0, limit)
+    df = _to_dataframe(table, date_col)
+    del table
 
     metadata = {
         "path": str(file_path),
+        "cache_path": str(cache_path),
+        "cache_hit": cache_hit,
         "row_count": int(len(df)),
         "columns": df.columns.tolist(),
         "primary_key": source_cfg.get("primary_key"),
@@ -79,15 +207,65 @@ def extract_sources(
     dataframes: Dict[str, pd.DataFrame] = {}
     metadata: Dict[str, Dict[str, Any]] = {}
 
-    for source_name, source_cfg in config.get("sources", {}).items():
-        result = _read_source(source_name, source_cfg, base_dir, limit)
-        dataframes.update(result.dataframes)
-        metadata.update(result.metadata)
+    sources = config.get("sources", {})
+    if sources:
+        # Sources are independent and Arrow parses outside the GIL, so read them concurrently.
+        with ThreadPoolExecutor(max_workers=min(MAX_EXTRACT_WORKERS, len(sources))) as executor:
+            futures = [
+                executor.submit(_read_source, source_name, source_cfg, base_dir, limit)
+                for source_name, source_cfg in sources.items()
+            ]
+            for future in futures:
+                result = future.result()
+                dataframes.update(result.dataframes)
+                metadata.update(result.metadata)
 
     LOGGER.info("Extraction completed for %d sources", len(dataframes))
     return ExtractionResult(dataframes=dataframes, metadata=metadata)
 
 
+def iter_source_chunks(
+    source_name: str,
+    config_path: Optional[str] = None,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a single configured source as DataFrames of at most ``chunksize`` rows.
+
+    Parameters
+    ----------
+    source_name : str
+        Key of the source under ``sources`` in config.yaml.
+    config_path : Optional[str]
+        Alternative path to the YAML configuration.
+    chunksize : int
+        Maximum number of rows per yielded DataFrame.
+    """
+
+    config = load_pipeline_config(config_path)
+    base_dir = Path(config.get("paths", {}).get("raw_data_dir", "data"))
+    source_cfg = config.get("sources", {}).get(source_name)
+    if source_cfg is None:
+        raise KeyError(f"Source `{source_name}` is not configured in config.yaml.")
+
+    file_path = _source_file_path(source_name, source_cfg, base_dir)
+    cache_path = _cache_path(source_name, base_dir)
+    table: Optional[pa.Table] = None
+    if not _is_cache_fresh(cache_path, file_path):
+        # Build the cache first so every chunk shares the dtypes inferred from the whole file.
+        table = _parse_and_cache(source_name, source_cfg, file_path, cache_path)
+    batches: Iterable[pa.RecordBatch]
+    if _is_cache_fresh(cache_path, file_path):
+        table = None
+        batches = pq.ParquetFile(cache_path, memory_map=True).iter_batches(batch_size=chunksize)
+    else:
+        # The cache could not be written; chunk the parsed table instead.
+        batches = table.to_batches(max_chunksize=chunksize)
+
+    for table in _rebatch(batches, chunksize):
+        yield _to_dataframe(table, source_cfg.get("date_column"))
+
+
 def main(config_path: Optional[str] = None, limit: Optional[int] = None) -> ExtractionResult:
     """CLI-friendly entrypoint."""
 
@@ -2,17 +2,74 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import parquet as pq
 
 from src.pipeline.extract import extract_sources
-from src.pipeline.transform import TransformationResult, transform_datasets
+from src.pipeline.transform import TransformationResult, _dedup_first, transform_datasets
 from src.utils.db_connector import DBConnector
 from src.utils.logger import get_logger
 
 LOGGER = get_logger(__name__)
 
+FACT_BATCH_SIZE = 100_000
+
+HOST_TRACKED_COLUMNS = [
+    "host_name",
+    "host_since",
+    "host_response_time",
+    "host_response_rate",
+    "host_is_superhost",
+    "host_listings_count",
+    "host_total_listings",
+    "host_verifications",
+    "host_identity_verified",
+]
+HOST_COLUMNS = ["host_id", *HOST_TRACKED_COLUMNS]
+LISTING_TRACKED_COLUMNS = [
+    "listing_name",
+    "room_type",
+    "accommodates",
+    "bathrooms",
+    "bedrooms",
+    "beds",
+    "amenities_hash",
+    "cancellation_policy",
+    "minimum_nights",
+    "maximum_nights",
+    "instant_bookable",
+    "neighborhood",
+]
+LISTING_COLUMNS = ["listing_id", "host_id", *LISTING_TRACKED_COLUMNS]
+SNAPSHOT_DIMENSIONS = ["dim_neighborhood", "dim_property_type", "dim_date"]
+FACT_TABLES = ["fact_listing_daily_metrics", "fact_review"]
+# ADBC reports NUMERIC columns as opaque strings it cannot COPY back; decimals it can, and
+# PostgreSQL rounds them to the column's declared scale on receipt.
+ADBC_NUMERIC_TYPE = pa.decimal128(38, 9)
+ADBC_TYPNAME_KEY = b"ADBC:postgresql:typname"
+
+
+def _read_frame(data: Union[pd.DataFrame, Path]) -> pd.DataFrame:
+    if isinstance(data, pd.DataFrame):
+        return data
+    return pq.read_table(data, memory_map=True).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _iter_frames(data: Union[pd.DataFrame, Path], batch_size: int = FACT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+    """Yield the table in record batches so persisted facts never sit fully in memory."""
+
+    if isinstance(data, pd.DataFrame):
+        yield data
+        return
+    parquet_file = pq.ParquetFile(data, memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield pa.Table.from_batches([batch]).to_pandas(types_mapper=pd.ArrowDtype)
+
 
 def _ensure_columns(dataframe: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     df = dataframe.copy()
@@ -26,7 +83,8 @@ def _ensure_schema(connector: DBConnector, schema: str) -> None:
     connector.run_query(f"CREATE SCHEMA IF NOT EXISTS {schema}")
 
 
-def _diff_condition(alias_left: str, alias_right: str, columns: Iterable[str]) -> str:
+@lru_cache(maxsize=None)
+def _diff_condition(alias_left: str, alias_right: str, columns: Tuple[str, ...]) -> str:
     return " OR ".join(
         [
             f"COALESCE({alias_left}.{col}::text, '') IS DISTINCT FROM COALESCE({alias_right}.{col}::text, '')"
@@ -35,22 +93,103 @@ def _diff_condition(alias_left: str, alias_right: str, columns: Iterable[str]) -
     )
 
 
+def _append_dataframe(
+    connector: DBConnector,
+    dataframe: pd.DataFrame,
+    schema: str,
+    table_name: str,
+    connection: Optional[Any] = None,
+) -> None:
+    if connector.supports_copy:
+        connector.copy_dataframe(dataframe, table_name, schema=schema, connection=connection)
+        return
+    connector.load_dataframe(
+        dataframe,
+        table_name=table_name,
+        schema=schema,
+        if_exists="append",
+    )
+
+
 def _stage_dataframe(
     connector: DBConnector,
     dataframe: pd.DataFrame,
     staging_schema: str,
     staging_table: str,
+    target_schema: str,
+    target_table: str,
+    connection: Optional[Any] = None,
 ) -> None:
-    _ensure_schema(connector, staging_schema)
-    dataframe = dataframe.copy()
-    connector.load_dataframe(
+    if not connector.supports_copy:
+        _ensure_schema(connector, staging_schema)
+        connector.load_dataframe(
+            dataframe,
+            table_name=staging_table,
+            schema=staging_schema,
+            if_exists="replace",
+        )
+        return
+    # Staging rows are disposable, so skip WAL for the table and the commit flush.
+    # Column types come from the target, so the SCD2 diff compares like with like.
+    column_list = ", ".join(dataframe.columns)
+    setup_statements = [
+        "SET LOCAL synchronous_commit = off",
+        f"CREATE SCHEMA IF NOT EXISTS {staging_schema}",
+        f"DROP TABLE IF EXISTS {staging_schema}.{staging_table}",
+        f"CREATE UNLOGGED TABLE {staging_schema}.{staging_table} AS "
+        f"SELECT {column_list} FROM {target_schema}.{target_table} WITH NO DATA",
+    ]
+    connector.copy_dataframe(
         dataframe,
-        table_name=staging_table,
+        staging_table,
         schema=staging_schema,
-        if_exists="replace",
+        setup_statements=setup_statements,
+        connection=connection,
     )
 
 
+@lru_cache(maxsize=None)
+def _build_merge_sql(
+    target_schema: str,
+    table_name: str,
+    staging_schema: str,
+    staging_table: str,
+    natural_key: str,
+    tracked_columns: Tuple[str, ...],
+    columns: Tuple[str, ...],
+) -> str:
+    """Render the SCD2 close-and-insert statement; identical across runs for a given table."""
+
+    diff = _diff_condition("dim", "s", tracked_columns)
+    column_list = ", ".join(columns)
+    select_list = ", ".join([f"s.{col}" for col in columns])
+
+    # Every sub-statement sees the same snapshot, so the INSERT still joins against the
+    # versions the `closed` CTE expires and picks up both new and changed entities.
+    return f"""
+        WITH staged AS (
+            SELECT * FROM {staging_schema}.{staging_table}
+        ), closed AS (
+            UPDATE {target_schema}.{table_name} AS dim
+            SET effective_to = NOW(),
+                is_current = FALSE
+            FROM staged s
+            WHERE dim.is_current = TRUE
+              AND dim.{natural_key} = s.{natural_key}
+              AND ({diff})
+            RETURNING dim.{natural_key}
+        )
+        INSERT INTO {target_schema}.{table_name} ({column_list})
+        SELECT {select_list}
+        FROM staged s
+        LEFT JOIN {target_schema}.{table_name} dim
+          ON dim.{natural_key} = s.{natural_key}
+         AND dim.is_current = TRUE
+        WHERE dim.{natural_key} IS NULL
+           OR ({diff});
+    """
+
+
 def scd2_upsert(
     connector: DBConnector,
     dataframe: pd.DataFrame,
@@ -59,6 +198,7 @@ def scd2_upsert(
     tracked_columns: List[str],
     schema: Optional[str] = None,
     columns: Optional[List[str]] = None,
+    connection: Optional[Any] = None,
 ) -> None:
     """
     Perform a Slowly Changing Dimension Type 2 upsert using staging tables.
@@ -77,6 +217,10 @@ def scd2_upsert(
         Columns that trigger a new version when changes are detected.
     schema : Optional[str]
         Warehouse schema override. Defaults to connector.db_config.schema.
+    columns : Optional[List[str]]
+        Subset of dataframe columns to stage and insert.
+    connection : Optional[Any]
+        Open DBAPI connection to reuse; a pooled one is borrowed when omitted.
     """
 
     if dataframe.empty:
@@ -91,9 +235,9 @@ def scd2_upsert(
     staged_df = dataframe.copy()
     if columns:
         staged_df = staged_df[columns]
-    staged_df = staged_df.drop_duplicates(subset=[natural_key]).copy()
     if natural_key not in staged_df.columns:
         raise KeyError(f"Natural key `{natural_key}` not present in dataframe for {table_name}.")
+    staged_df = _dedup_first(staged_df, natural_key)
     if not tracked_columns:
         tracked_columns = [
             col
@@ -107,44 +251,20 @@ def scd2_upsert(
     staged_df["effective_to"] = pd.NaT
     staged_df["is_current"] = True
 
-    _stage_dataframe(connector, staged_df, staging_schema, staging_table)
-
-    diff = _diff_condition("dim", "s", tracked_columns)
-
-    update_sql = f"""
-        WITH staged AS (
-            SELECT * FROM {staging_schema}.{staging_table}
-        )
-        UPDATE {target_schema}.{table_name} AS dim
-        SET effective_to = NOW(),
-            is_current = FALSE
-        FROM staged s
-        WHERE dim.is_current = TRUE
-          AND dim.{natural_key} = s.{natural_key}
-          AND ({diff});
-    """
-    connector.run_query(update_sql)
+    _stage_dataframe(connector, staged_df, staging_schema, staging_table, target_schema, table_name, connection)
 
     columns = [col for col in staged_df.columns if col not in {"host_key", "listing_key"}]
-    column_list = ", ".join(columns)
-    select_list = ", ".join([f"s.{col}" for col in columns])
-
-    insert_sql = f"""
-        WITH staged AS (
-            SELECT * FROM {staging_schema}.{staging_table}
-        ), changed AS (
-            SELECT s.*
-            FROM staged s
-            LEFT JOIN {target_schema}.{table_name} dim
-              ON dim.{natural_key} = s.{natural_key}
-             AND dim.is_current = TRUE
-            WHERE dim.{natural_key} IS NULL
-               OR ({diff})
-        )
-        INSERT INTO {target_schema}.{table_name} ({column_list})
-        SELECT {select_list} FROM changed;
-    """
-    connector.run_query(insert_sql)
+    merge_sql = _build_merge_sql(
+        target_schema,
+        table_name,
+        staging_schema,
+        staging_table,
+        natural_key,
+        tuple(tracked_columns),
+        tuple(columns),
+    )
+    with connector.raw_transaction(connection) as cursor:
+        cursor.execute(merge_sql)
 
 
 def replace_dimension_snapshot(
@@ -152,6 +272,7 @@ def replace_dimension_snapshot(
     dataframe: pd.DataFrame,
     table_name: str,
     schema: Optional[str] = None,
+    connection: Optional[Any] = None,
 ) -> None:
     """Replace Type 1 dimensions (date, neighborhood, property_type) using truncate + insert."""
 
@@ -160,14 +281,33 @@ def replace_dimension_snapshot(
         return
 
     target_schema = schema or connector.db_config.schema
-    truncate_sql = f"TRUNCATE TABLE {target_schema}.{table_name} RESTART IDENTITY CASCADE;"
+    truncate_sql = f"TRUNCATE TABLE {target_schema}.{table_name} RESTART IDENTITY CASCADE"
+    if connector.supports_copy:
+        # TRUNCATE and COPY commit together, so readers never observe an empty dimension.
+        connector.copy_dataframe(
+            dataframe,
+            table_name,
+            schema=target_schema,
+            setup_statements=[truncate_sql],
+            connection=connection,
+        )
+        return
     connector.run_query(truncate_sql)
-    connector.load_dataframe(
-        dataframe,
-        table_name=table_name,
-        schema=target_schema,
-        if_exists="append",
-    )
+    _append_dataframe(connector, dataframe, target_schema, table_name)
+
+
+def _adbc_arrow_table(dataframe: pd.DataFrame, target: pa.Schema) -> pa.Table:
+    """Convert ``dataframe`` to Arrow with the target table's column types, as binary COPY requires."""
+
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    fields = []
+    for name in table.column_names:
+        field = target.field(name)
+        if (field.metadata or {}).get(ADBC_TYPNAME_KEY) == b"numeric":
+            fields.append(pa.field(name, ADBC_NUMERIC_TYPE))
+        else:
+            fields.append(pa.field(name, field.type))
+    return table.cast(pa.schema(fields))
 
 
 def append_fact(
@@ -175,138 +315,162 @@ def append_fact(
     dataframe: pd.DataFrame,
     table_name: str,
     schema: Optional[str] = None,
+    connection: Optional[Any] = None,
 ) -> None:
     """Append fact records (append-only)."""
 
-    if dataframe.empty:
-        LOGGER.warning("No fact rows provided for %s; skipping append.", table_name)
-        return
-    target_schema = schema or connector.db_config.schema
-    connector.load_dataframe(
-        dataframe,
-        table_name=table_name,
-        schema=target_schema,
-        if_exists="append",
-    )
+    append_fact_batches(connector, [dataframe], table_name, schema=schema, connection=connection)
 
 
-def load_all(
+def append_fact_batches(
     connector: DBConnector,
-    transformation: TransformationResult,
+    batches: Iterable[pd.DataFrame],
+    table_name: str,
+    schema: Optional[str] = None,
+    connection: Optional[Any] = None,
 ) -> None:
-    """Load every dimension and fact DataFrame produced by the transform stage."""
+    """
+    Append every batch of a fact table in one transaction.
+
+    Facts are append-only, so a load that failed halfway must leave nothing committed;
+    otherwise a retry would append the committed batches a second time.
+    """
+
+    target_schema = schema or connector.db_config.schema
+    row_count = 0
+
+    def _non_empty() -> Iterator[pd.DataFrame]:
+        nonlocal row_count
+        for batch in batches:
+            if not batch.empty:
+                row_count += len(batch)
+                yield batch
+
+    if connector.db_config.bulk_loader == "adbc":
+        with connector.adbc_cursor() as cursor:
+            target = cursor.connection.adbc_get_table_schema(table_name, db_schema_filter=target_schema)
+            for batch in _non_empty():
+                LOGGER.info("Ingesting %s rows into %s.%s via ADBC", len(batch), target_schema, table_name)
+                cursor.adbc_ingest(
+                    table_name,
+                    _adbc_arrow_table(batch, target),
+                    mode="append",
+                    db_schema_name=target_schema,
+                )
+    elif connector.supports_copy:
+        connector.copy_dataframes(_non_empty(), table_name, schema=target_schema, connection=connection)
+    else:
+        # ``to_sql`` inserts a single frame in one transaction, so gather the batches first.
+        frames = list(_non_empty())
+        if frames:
+            _append_dataframe(connector, pd.concat(frames, ignore_index=True), target_schema, table_name)
+    if not row_count:
+        LOGGER.warning("No fact rows provided for %s; skipping append.", table_name)
 
-    target_schema = connector.db_config.schema
-    _ensure_schema(connector, target_schema)
-    if connector.db_config.staging_schema:
-        _ensure_schema(connector, connector.db_config.staging_schema)
 
+def load_dim_host(
+    connector: DBConnector,
+    data: Union[pd.DataFrame, Path],
+    connection: Optional[Any] = None,
+) -> None:
     scd2_upsert(
         connector,
-        _ensure_columns(
-            transformation.dimensions["dim_host"],
-            [
-                "host_id",
-                "host_name",
-                "host_since",
-                "host_response_time",
-                "host_response_rate",
-                "host_is_superhost",
-                "host_listings_count",
-                "host_total_listings",
-                "host_verifications",
-                "host_identity_verified",
-            ],
-        ),
+        _ensure_columns(_read_frame(data), HOST_COLUMNS),
         table_name="dim_host",
         natural_key="host_id",
-        tracked_columns=[
-            "host_name",
-            "host_since",
-            "host_response_time",
-            "host_response_rate",
-            "host_is_superhost",
-            "host_listings_count",
-            "host_total_listings",
-            "host_verifications",
-            "host_identity_verified",
-        ],
-        columns=[
-            "host_id",
-            "host_name",
-            "host_since",
-            "host_response_time",
-            "host_response_rate",
-            "host_is_superhost",
-            "host_listings_count",
-            "host_total_listings",
-            "host_verifications",
-            "host_identity_verified",
-        ],
+        tracked_columns=HOST_TRACKED_COLUMNS,
+        columns=HOST_COLUMNS,
+        connection=connection,
     )
 
+
+def load_dim_listing(
+    connector: DBConnector,
+    data: Union[pd.DataFrame, Path],
+    connection: Optional[Any] = None,
+) -> None:
     scd2_upsert(
         connector,
-        _ensure_columns(
-            transformation.dimensions["dim_listing"],
-            [
-                "listing_id",
-                "host_id",
-                "listing_name",
-                "room_type",
-                "accommodates",
-                "bathrooms",
-                "bedrooms",
-                "beds",
-                "amenities_hash",
-                "cancellation_policy",
-                "minimum_nights",
-                "maximum_nights",
-                "instant_bookable",
-                "neighborhood",
-            ],
-        ),
+        _ensure_columns(_read_frame(data), LISTING_COLUMNS),
         table_name="dim_listing",
         natural_key="listing_id",
-        tracked_columns=[
-            "listing_name",
-            "room_type",
-            "accommodates",
-            "bathrooms",
-            "bedrooms",
-            "beds",
-            "amenities_hash",
-            "cancellation_policy",
-            "minimum_nights",
-            "maximum_nights",
-            "instant_bookable",
-            "neighborhood",
-        ],
-        columns=[
-            "listing_id",
-            "host_id",
-            "listing_name",
-            "room_type",
-            "accommodates",
-            "bathrooms",
-            "bedrooms",
-            "beds",
-            "amenities_hash",
-            "cancellation_policy",
-            "minimum_nights",
-            "maximum_nights",
-            "instant_bookable",
-            "neighborhood",
-        ],
+        tracked_columns=LISTING_TRACKED_COLUMNS,
+        columns=LISTING_COLUMNS,
+        connection=connection,
     )
 
-    replace_dimension_snapshot(connector, transformation.dimensions["dim_neighborhood"], "dim_neighborhood")
-    replace_dimension_snapshot(connector, transformation.dimensions["dim_property_type"], "dim_property_type")
-    if "dim_date" in transformation.dimensions:
-        replace_dimension_snapshot(connector, transformation.dimensions["dim_date"], "dim_date")
 
-    append_fact(connector, transformation.facts["fact_listing_daily_metrics"], "fact_listing_daily_metrics")
-    append_fact(connector, transformation.facts["fact_review"], "fact_review")
+def _snapshot_loader(table_name: str) -> Callable[..., None]:
+    def _load(connector: DBConnector, data: Union[pd.DataFrame, Path], connection: Optional[Any] = None) -> None:
+        replace_dimension_snapshot(connector, _read_frame(data), table_name, connection=connection)
+
+    return _load
+
+
+def _fact_loader(table_name: str) -> Callable[..., None]:
+    def _load(connector: DBConnector, data: Union[pd.DataFrame, Path], connection: Optional[Any] = None) -> None:
+        append_fact_batches(connector, _iter_frames(data), table_name, connection=connection)
+
+    return _load
+
+
+# Dimensions first: fact rows reference the dimension keys loaded before them. dim_listing
+# references the other dimensions, whose snapshot TRUNCATE ... CASCADE would empty it, so it
+# loads after them.
+TABLE_LOADERS: Dict[str, Callable[..., None]] = {
+    "dim_host": load_dim_host,
+    **{table_name: _snapshot_loader(table_name) for table_name in SNAPSHOT_DIMENSIONS},
+    "dim_listing": load_dim_listing,
+    **{table_name: _fact_loader(table_name) for table_name in FACT_TABLES},
+}
+
+
+def load_table(
+    connector: DBConnector,
+    table_name: str,
+    data: Union[pd.DataFrame, Path],
+    connection: Optional[Any] = None,
+) -> None:
+    """
+    Load a single warehouse table from its transform output.
+
+    Parameters
+    ----------
+    connector : DBConnector
+        Database connector aware of schemas and credentials.
+    table_name : str
+        Target table; must be a key of ``TABLE_LOADERS``.
+    data : Union[pandas.DataFrame, pathlib.Path]
+        In-memory frame or persisted Parquet intermediate for the table.
+    connection : Optional[Any]
+        Open DBAPI connection to reuse; a pooled one is borrowed when omitted.
+    """
+
+    try:
+        loader = TABLE_LOADERS[table_name]
+    except KeyError as exc:
+        raise KeyError(f"No loader registered for table `{table_name}`.") from exc
+    loader(connector, data, connection=connection)
+
+
+def load_all(
+    connector: DBConnector,
+    transformation: TransformationResult,
+) -> None:
+    """Load every dimension and fact DataFrame produced by the transform stage."""
+
+    target_schema = connector.db_config.schema
+    _ensure_schema(connector, target_schema)
+    if connector.db_config.staging_schema:
+        _ensure_schema(connector, connector.db_config.staging_schema)
+
+    outputs = {**transformation.dimensions, **transformation.facts}
+    # One session for the whole load: each table still commits on its own, but the
+    # connection setup is paid once.
+    with connector.raw_connection() as connection:
+        for table_name in TABLE_LOADERS:
+            if table_name in outputs:
+                load_table(connector, table_name, outputs[table_name], connection=connection)
 
 
 def main(config_path: Optional[str] = None, limit: Optional[int] = None) -> None:
@@ -10,8 +10,8 @@ from src.pipeline.extract import extract_sources
 from src.pipeline.load import load_all
 from src.pipeline.transform import transform_datasets
 from src.pipeline.validate import validate_dataframes
-from src.utils.db_connector import DBConnector
-from src.utils.logger import get_logger
+from src.utils.db_connector import DBConnector, load_pipeline_config
+from src.utils.logger import get_logger, shutdown_logging
 
 LOGGER = get_logger(__name__)
 
@@ -25,7 +25,9 @@ def run_pipeline(config_path: Optional[str] = None, limit: Optional[int] = None)
     validate_dataframes(extraction.dataframes)
     LOGGER.info("Validation completed")
 
-    transformation = transform_datasets(extraction)
+    output_dir = Path(load_pipeline_config(config_path).get("paths", {}).get("output_dir", "output"))
+    transformation = transform_datasets(extraction, output_dir=output_dir / "intermediate")
+    del extraction
     LOGGER.info("Transformation completed")
 
     connector = DBConnector(config_path=config_path)
@@ -39,6 +41,8 @@ def main(config_path: Optional[str] = None, limit: Optional[int] = None) -> None
     except Exception as exc:
         LOGGER.exception("Pipeline failed: %s", exc)
         raise
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -4,15 +4,25 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import parquet as pq
 
 from src.pipeline.extract import ExtractionResult, extract_sources
 from src.utils.logger import get_logger
 
 LOGGER = get_logger(__name__)
 
+# pandas 3 always copies on write; on 2.x opt in so helpers can work on lazy copies.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+INTERMEDIATE_ROW_GROUP_SIZE = 256_000
 
 PRICE_TIERS = [
     (0, 100, "budget"),
@@ -20,35 +30,108 @@ PRICE_TIERS = [
     (200, 400, "premium"),
     (400, math.inf, "luxury"),
 ]
+PRICE_TIER_BINS = [lower for lower, _, _ in PRICE_TIERS] + [PRICE_TIERS[-1][1]]
+PRICE_TIER_LABELS = [label for _, _, label in PRICE_TIERS]
+NUMERIC_PATTERN = r"^-?(\d+\.?\d*|\.\d+)$"
+LOW_CARDINALITY_COLUMNS = ["room_type", "cancellation_policy", "host_response_time", "neighborhood", "city"]
+TRUTHY_VALUES = ["true", "t", "1", "yes", "y"]
+DAY_NAMES = np.array(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"])
+MONTH_NAMES = np.array(
+    [
+        "January",
+        "February",
+        "March",
+        "April",
+        "May",
+        "June",
+        "July",
+        "August",
+        "September",
+        "October",
+        "November",
+        "December",
+    ]
+)
+
+
+def _zero_invalid(prices: np.ndarray) -> np.ndarray:
+    # Nulls surface as NaN; zero them together with negatives in one pass.
+    return np.where(np.isnan(prices) | (prices < 0.0), 0.0, prices)
 
 
 def _clean_price(price_series: pd.Series) -> pd.Series:
-    normalized = (
-        price_series.astype(str)
-        .str.replace(r"[^\d.-]", "", regex=True)
+    if pd.api.types.is_numeric_dtype(price_series) and not pd.api.types.is_bool_dtype(price_series):
+        # Already typed by the reader: no string round-trip needed.
+        prices = price_series.to_numpy(dtype="float64", na_value=np.nan)
+        return pd.Series(_zero_invalid(prices), index=price_series.index)
+    values = pa.array(price_series.astype("string"))
+    stripped = pc.replace_substring_regex(values, pattern=r"[^0-9.\-]", replacement="")
+    # Arrow casts have no coerce mode, so null out leftovers such as "" or "1.2.3" first.
+    parseable = pc.if_else(
+        pc.match_substring_regex(stripped, pattern=NUMERIC_PATTERN),
+        stripped,
+        pa.scalar(None, type=stripped.type),
     )
-    return pd.to_numeric(normalized, errors="coerce").fillna(0).clip(lower=0)
+    prices = pc.cast(parseable, pa.float64()).to_numpy(zero_copy_only=False)
+    return pd.Series(_zero_invalid(prices), index=price_series.index)
 
 
 def _booleanize(series: pd.Series) -> pd.Series:
-    return (
-        series.astype(str)
-        .str.strip()
-        .str.lower()
-        .isin(["true", "t", "1", "yes", "y"])
-    )
+    if pd.api.types.is_bool_dtype(series):
+        return pd.Series(series.to_numpy(dtype=bool, na_value=False), index=series.index)
+    values = pa.array(series.astype("string"))
+    normalized = pc.utf8_lower(pc.utf8_trim_whitespace(values))
+    matches = pc.is_in(normalized, value_set=pa.array(TRUTHY_VALUES, type=values.type))
+    return pd.Series(matches.to_numpy(zero_copy_only=False), index=series.index)
+
+
+def _dedup_first(df: pd.DataFrame, keys: Union[str, List[str]]) -> pd.DataFrame:
+    """Keep the first row per key (like ``drop_duplicates``) using Arrow's hash aggregation."""
+
+    key_columns = [keys] if isinstance(keys, str) else list(keys)
+    try:
+        key_table = pa.Table.from_pandas(df[key_columns], preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object keys cannot become Arrow arrays; fall back to pandas.
+        return df.drop_duplicates(subset=key_columns)
+
+    # Only the keys go through Arrow; taking the first row number per group keeps every
+    # other column (and its dtype) exactly as in the input.
+    key_table = key_table.append_column("row_number", pa.array(np.arange(len(df), dtype=np.int64)))
+    first_rows = key_table.group_by(key_columns).aggregate([("row_number", "min")])["row_number_min"]
+    return df.take(np.sort(first_rows.to_numpy()))
+
+
+def _to_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    """Store low-cardinality text columns as ``category`` (int codes + one shared dictionary)."""
+
+    casts = {col: "category" for col in LOW_CARDINALITY_COLUMNS if col in df.columns}
+    if not casts:
+        return df
+    # An all-empty CSV column arrives as ``null[pyarrow]``, whose null categories pandas rejects.
+    null_typed = {
+        col: "string[pyarrow]"
+        for col in casts
+        if isinstance(df[col].dtype, pd.ArrowDtype) and pa.types.is_null(df[col].dtype.pyarrow_dtype)
+    }
+    if null_typed:
+        df = df.astype(null_typed)
+    return df.astype(casts)
+
 
+def _hash_series(series: pd.Series) -> pd.Series:
+    """Return a stable signed 64-bit hash per value (fits a BIGINT column); nulls stay null."""
 
-def _price_tier(price: float) -> str:
-    for lower, upper, label in PRICE_TIERS:
-        if lower <= price < upper:
-            return label
-    return "unknown"
+    normalized = series.astype("string").str.lower()
+    hashed = pd.util.hash_pandas_object(normalized, index=False).to_numpy().view(np.int64)
+    return pd.Series(hashed, index=series.index, dtype="Int64").mask(normalized.isna())
 
 
 def _calculate_occupancy_rate(listing_df: pd.DataFrame) -> pd.Series:
-    availability = listing_df.get("availability_365", pd.Series([0] * len(listing_df)))
-    return ((365 - availability) / 365).clip(lower=0, upper=1).round(4)
+    if "availability_365" not in listing_df:
+        return pd.Series(1.0, index=listing_df.index)
+    availability = listing_df["availability_365"].to_numpy(dtype="float64", na_value=np.nan)
+    return pd.Series(np.round(np.clip((365 - availability) * (1 / 365), 0, 1), 4), index=listing_df.index)
 
 
 def _calculate_estimated_revenue(prices: pd.Series, occupancy_rates: pd.Series) -> pd.Series:
@@ -68,9 +151,9 @@ def _transform_dim_host(listings: pd.DataFrame) -> pd.DataFrame:
         "host_identity_verified",
     ]
     available_cols = [col for col in host_cols if col in listings.columns]
-    host_df = listings[available_cols].drop_duplicates(subset=["host_id"]).copy()
-    host_df["host_is_superhost"] = _booleanize(host_df.get("host_is_superhost", False))
-    host_df["host_identity_verified"] = _booleanize(host_df.get("host_identity_verified", False))
+    host_df = _dedup_first(listings[available_cols], "host_id")
+    host_df["host_is_superhost"] = _booleanize(host_df.get("host_is_superhost", pd.Series(False, index=host_df.index)))
+    host_df["host_identity_verified"] = _booleanize(host_df.get("host_identity_verified", pd.Series(False, index=host_df.index)))
     if "host_response_rate" in host_df.columns:
         host_df["host_response_rate"] = (
             host_df["host_response_rate"]
@@ -82,32 +165,33 @@ def _transform_dim_host(listings: pd.DataFrame) -> pd.DataFrame:
         host_df["host_verifications"] = ""
     host_df["host_since"] = pd.to_datetime(host_df.get("host_since"), errors="coerce")
     host_df.rename(columns={"calculated_host_listings_count": "host_total_listings"}, inplace=True)
-    return host_df
+    return _to_categorical(host_df)
 
 
-def _transform_dim_listing(listings: pd.DataFrame) -> pd.DataFrame:
-    listing_df = listings.copy()
-    if "id" in listing_df.columns:
-        listing_df.rename(columns={"id": "listing_id"}, inplace=True)
-    if "name" in listing_df.columns:
-        listing_df.rename(columns={"name": "listing_name"}, inplace=True)
-    listing_df["price"] = _clean_price(listing_df.get("price", 0))
+def _transform_dim_listing(listings: pd.DataFrame, price: Optional[pd.Series] = None) -> pd.DataFrame:
+    listing_df = listings.rename(
+        columns={
+            "id": "listing_id",
+            "name": "listing_name",
+            "neighbourhood": "neighborhood",
+            "neighbourhood_group": "neighborhood_group",
+        }
+    )
+    listing_df["price"] = price if price is not None else _clean_price(listing_df.get("price", 0))
     for column in ["instant_bookable", "has_availability"]:
         if column in listing_df.columns:
             listing_df[column] = _booleanize(listing_df[column])
         else:
             listing_df[column] = False
-    listing_df["amenities_hash"] = listing_df.get("amenities", "").astype(str).str.lower()
-    if "neighbourhood" in listing_df.columns:
-        listing_df.rename(columns={"neighbourhood": "neighborhood"}, inplace=True)
-    if "neighbourhood_group" in listing_df.columns:
-        listing_df.rename(columns={"neighbourhood_group": "neighborhood_group"}, inplace=True)
+    listing_df["amenities_hash"] = _hash_series(
+        listing_df.get("amenities", pd.Series("", index=listing_df.index))
+    )
     for numeric_col in ["bathrooms", "bedrooms", "beds", "accommodates", "maximum_nights"]:
         if numeric_col not in listing_df.columns:
             listing_df[numeric_col] = pd.NA
     if "cancellation_policy" not in listing_df.columns:
         listing_df["cancellation_policy"] = "not_specified"
-    return listing_df
+    return _to_categorical(listing_df)
 
 
 def _transform_dim_neighborhood(listings: pd.DataFrame) -> pd.DataFrame:
@@ -123,16 +207,16 @@ def _transform_dim_neighborhood(listings: pd.DataFrame) -> pd.DataFrame:
     df["state"] = ""
     df["country"] = ""
     df["geo_hash"] = ""
-    df = df.drop_duplicates(subset=["neighborhood_name"])
-    return df
+    df = _dedup_first(df, "neighborhood_name")
+    return _to_categorical(df)
 
 
 def _transform_dim_property_type(listings: pd.DataFrame) -> pd.DataFrame:
     if "property_type" in listings.columns:
-        df = listings[["property_type", "room_type"]].drop_duplicates().copy()
+        df = _dedup_first(listings[["property_type", "room_type"]], ["property_type", "room_type"])
         df.rename(columns={"property_type": "property_type_name", "room_type": "property_category"}, inplace=True)
     else:
-        df = listings[["room_type"]].drop_duplicates().copy()
+        df = _dedup_first(listings[["room_type"]], "room_type")
         df.rename(columns={"room_type": "property_type_name"}, inplace=True)
         df["property_category"] = df["property_type_name"]
     df["description"] = ""
@@ -140,11 +224,13 @@ def _transform_dim_property_type(listings: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _build_fact_listing_daily_metrics(listings: pd.DataFrame) -> pd.DataFrame:
-    fact_df = listings.copy()
-    if "id" in fact_df.columns:
-        fact_df.rename(columns={"id": "listing_id"}, inplace=True)
-    fact_df["price"] = _clean_price(fact_df.get("price", 0))
+def _build_fact_listing_daily_metrics(
+    listings: pd.DataFrame,
+    price: Optional[pd.Series] = None,
+    last_review: Optional[pd.Series] = None,
+) -> pd.DataFrame:
+    fact_df = listings.rename(columns={"id": "listing_id"})
+    fact_df["price"] = price if price is not None else _clean_price(fact_df.get("price", 0))
     for monetary_col in ["cleaning_fee", "security_deposit"]:
         if monetary_col not in fact_df.columns:
             fact_df[monetary_col] = 0
@@ -155,26 +241,52 @@ def _build_fact_listing_daily_metrics(listings: pd.DataFrame) -> pd.DataFrame:
         fact_df["maximum_nights"] = fact_df["minimum_nights"]
     fact_df["occupancy_rate"] = _calculate_occupancy_rate(fact_df)
     fact_df["estimated_revenue"] = _calculate_estimated_revenue(fact_df["price"], fact_df["occupancy_rate"])
-    fact_df["price_tier"] = fact_df["price"].apply(_price_tier)
-    fact_df["date_key"] = pd.to_datetime(fact_df.get("last_review")).dt.strftime("%Y%m%d").astype("Int64")
-    return fact_df
+    fact_df["price_tier"] = pd.cut(
+        fact_df["price"],
+        bins=PRICE_TIER_BINS,
+        labels=PRICE_TIER_LABELS,
+        right=False,
+    )
+    if last_review is None:
+        last_review = pd.to_datetime(fact_df.get("last_review"))
+    fact_df["date_key"] = last_review.dt.strftime("%Y%m%d").astype("Int64")
+    return _to_categorical(fact_df)
 
 
-def _build_fact_review(reviews: pd.DataFrame) -> pd.DataFrame:
-    fact_reviews = reviews.copy()
-    fact_reviews["date_key"] = pd.to_datetime(fact_reviews["date"], errors="coerce").dt.strftime("%Y%m%d").astype("Int64")
-    if "id" in fact_reviews.columns:
-        fact_reviews["review_id"] = fact_reviews["id"]
+def _build_fact_review(reviews: pd.DataFrame, review_dates: Optional[pd.Series] = None) -> pd.DataFrame:
+    if review_dates is None:
+        review_dates = pd.to_datetime(reviews["date"], errors="coerce")
+    if "id" in reviews.columns:
+        review_ids = reviews["id"]
     else:
-        fact_reviews["review_id"] = pd.RangeIndex(start=1, stop=len(fact_reviews) + 1)
-    return fact_reviews
+        review_ids = pd.RangeIndex(start=1, stop=len(reviews) + 1)
+    return reviews.assign(
+        date_key=review_dates.dt.strftime("%Y%m%d").astype("Int64"),
+        review_id=review_ids,
+    )
+
+
+def _to_date32(series: pd.Series) -> pa.Array:
+    timestamps = pa.array(series)
+    if pa.types.is_date32(timestamps.type):
+        return timestamps
+    return pc.cast(pc.floor_temporal(timestamps, unit="day"), pa.date32())
 
 
-def _build_dim_date(listings: pd.DataFrame, reviews: pd.DataFrame) -> pd.DataFrame:
+def _build_dim_date(
+    listings: pd.DataFrame,
+    reviews: pd.DataFrame,
+    last_review: Optional[pd.Series] = None,
+    review_dates: Optional[pd.Series] = None,
+) -> pd.DataFrame:
     date_series = []
-    if "last_review" in listings.columns:
+    if last_review is not None:
+        date_series.append(last_review)
+    elif "last_review" in listings.columns:
         date_series.append(pd.to_datetime(listings["last_review"], errors="coerce"))
-    if "date" in reviews.columns:
+    if review_dates is not None:
+        date_series.append(review_dates)
+    elif "date" in reviews.columns:
         date_series.append(pd.to_datetime(reviews["date"], errors="coerce"))
     if not date_series:
         return pd.DataFrame(
@@ -192,50 +304,100 @@ def _build_dim_date(listings: pd.DataFrame, reviews: pd.DataFrame) -> pd.DataFra
                 "created_at",
             ]
         )
-    dates = pd.concat(date_series).dropna().dt.normalize().drop_duplicates().sort_values()
-    dim_date = pd.DataFrame({"full_date": dates})
-    dim_date["date_key"] = dim_date["full_date"].dt.strftime("%Y%m%d").astype(int)
-    dim_date["day_of_week"] = dim_date["full_date"].dt.weekday + 1
-    dim_date["day_name"] = dim_date["full_date"].dt.day_name()
-    dim_date["week_of_year"] = dim_date["full_date"].dt.isocalendar().week.astype(int)
-    dim_date["month"] = dim_date["full_date"].dt.month
-    dim_date["month_name"] = dim_date["full_date"].dt.month_name()
-    dim_date["quarter"] = dim_date["full_date"].dt.quarter
-    dim_date["year"] = dim_date["full_date"].dt.year
-    dim_date["is_weekend"] = dim_date["day_of_week"].isin([6, 7])
-    dim_date["created_at"] = pd.Timestamp.utcnow()
+    dates = pa.chunked_array([_to_date32(series) for series in date_series], type=pa.date32())
+    unique_dates = pc.drop_null(pc.unique(dates))
+    unique_dates = unique_dates.take(pc.sort_indices(unique_dates))
+
+    year = pc.year(unique_dates).to_numpy()
+    month = pc.month(unique_dates).to_numpy()
+    day = pc.day(unique_dates).to_numpy()
+    weekday = pc.day_of_week(unique_dates).to_numpy()  # Monday = 0
+    dim_date = pd.DataFrame(
+        {
+            "full_date": unique_dates.to_pandas(date_as_object=False),
+            "date_key": year * 10000 + month * 100 + day,
+            "day_of_week": weekday + 1,
+            "day_name": DAY_NAMES[weekday],
+            "week_of_year": pc.iso_week(unique_dates).to_numpy(),
+            "month": month,
+            "month_name": MONTH_NAMES[month - 1],
+            "quarter": pc.quarter(unique_dates).to_numpy(),
+            "year": year,
+            "is_weekend": weekday >= 5,
+        }
+    )
+    dim_date["created_at"] = pd.Timestamp.now(tz="UTC")
     return dim_date
 
 
 @dataclass
 class TransformationResult:
-    dimensions: Dict[str, pd.DataFrame]
-    facts: Dict[str, pd.DataFrame]
+    """Dimension and fact tables, held in memory or as Parquet paths when persisted."""
+
+    dimensions: Dict[str, Union[pd.DataFrame, Path]]
+    facts: Dict[str, Union[pd.DataFrame, Path]]
 
 
-def transform_datasets(extraction: ExtractionResult) -> TransformationResult:
+def _persist(name: str, frame: pd.DataFrame, output_dir: Optional[Path]) -> Union[pd.DataFrame, Path]:
+    if output_dir is None:
+        return frame
+    path = output_dir / f"{name}.parquet"
+    pq.write_table(
+        pa.Table.from_pandas(frame, preserve_index=False),
+        path,
+        compression="zstd",
+        row_group_size=INTERMEDIATE_ROW_GROUP_SIZE,
+    )
+    LOGGER.info("Persisted %s (%s rows) to %s", name, len(frame), path)
+    return path
+
+
+def transform_datasets(
+    extraction: ExtractionResult,
+    output_dir: Optional[Union[str, Path]] = None,
+) -> TransformationResult:
+    """
+    Build the dimension and fact tables from the extracted sources.
+
+    Parameters
+    ----------
+    extraction : ExtractionResult
+        Output of the extract step.
+    output_dir : Optional[Union[str, Path]]
+        When provided, each table is written to ``{output_dir}/{name}.parquet`` as soon as it
+        is built and the result holds paths instead of DataFrames, keeping peak memory flat.
+    """
+
     listings = extraction.dataframes["listings"]
     reviews = extraction.dataframes.get("reviews", pd.DataFrame(columns=["listing_id", "date"]))
 
-    dim_host = _transform_dim_host(listings)
-    dim_listing = _transform_dim_listing(listings)
-    dim_neighborhood = _transform_dim_neighborhood(listings)
-    dim_property_type = _transform_dim_property_type(listings)
-    dim_date = _build_dim_date(listings, reviews)
+    # Parse shared columns once; several dimensions and facts derive from the same inputs.
+    price = _clean_price(listings["price"]) if "price" in listings.columns else None
+    last_review = pd.to_datetime(listings["last_review"], errors="coerce") if "last_review" in listings.columns else None
+    review_dates = pd.to_datetime(reviews["date"], errors="coerce") if "date" in reviews.columns else None
 
-    fact_listing = _build_fact_listing_daily_metrics(listings)
-    fact_reviews = _build_fact_review(reviews)
+    target_dir = Path(output_dir) if output_dir is not None else None
+    if target_dir is not None:
+        target_dir.mkdir(parents=True, exist_ok=True)
 
     dimensions = {
-        "dim_host": dim_host,
-        "dim_listing": dim_listing,
-        "dim_neighborhood": dim_neighborhood,
-        "dim_property_type": dim_property_type,
-        "dim_date": dim_date,
+        "dim_host": _persist("dim_host", _transform_dim_host(listings), target_dir),
+        "dim_listing": _persist("dim_listing", _transform_dim_listing(listings, price=price), target_dir),
+        "dim_neighborhood": _persist("dim_neighborhood", _transform_dim_neighborhood(listings), target_dir),
+        "dim_property_type": _persist("dim_property_type", _transform_dim_property_type(listings), target_dir),
+        "dim_date": _persist(
+            "dim_date",
+            _build_dim_date(listings, reviews, last_review=last_review, review_dates=review_dates),
+            target_dir,
+        ),
     }
     facts = {
-        "fact_listing_daily_metrics": fact_listing,
-        "fact_review": fact_reviews,
+        "fact_listing_daily_metrics": _persist(
+            "fact_listing_daily_metrics",
+            _build_fact_listing_daily_metrics(listings, price=price, last_review=last_review),
+            target_dir,
+        ),
+        "fact_review": _persist("fact_review", _build_fact_review(reviews, review_dates=review_dates), target_dir),
     }
 
     LOGGER.info(
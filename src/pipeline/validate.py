@@ -3,60 +3,203 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import pandera as pa
+import pyarrow as pyarrow_lib
 from pandera import Check, Column, DataFrameSchema
-from pandera.errors import SchemaErrors
+from pandera.accessors import pandas_accessor  # noqa: F401  (registers the ``DataFrame.pandera`` accessor)
+from pandera.errors import ParserError, SchemaErrors
+
+try:  # Optional: faster report serialization.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:  # Optional: run checks as Polars expressions instead of pandas operations.
+    import pandera.polars as pa_polars
+    import polars as pl
+except ImportError:  # pragma: no cover - depends on the environment
+    pa_polars = None
+    pl = None
 
 from src.utils.logger import get_logger
 
 LOGGER = get_logger(__name__)
 
-ROOM_TYPES = [
+# A tuple: the categorical codes follow this order, and the constant must stay immutable.
+ROOM_TYPES = (
     "Entire home/apt",
     "Private room",
     "Shared room",
     "Hotel room",
-]
-
-LISTINGS_SCHEMA = DataFrameSchema(
-    {
-        "id": Column(pa.Int64, Check.gt(0), nullable=False, unique=True),
-        "name": Column(pa.String, nullable=False),
-        "host_id": Column(pa.Int64, Check.gt(0), nullable=False),
-        "host_name": Column(pa.String, nullable=True),
-        "neighbourhood": Column(pa.String, nullable=True),
-        "room_type": Column(pa.String, Check.isin(ROOM_TYPES), nullable=False),
-        "price": Column(pa.Float64, Check.ge(0)),
-        "minimum_nights": Column(pa.Int64, Check.ge(1)),
-        "availability_365": Column(pa.Int64, Check.in_range(0, 365)),
-        "number_of_reviews": Column(pa.Int64, Check.ge(0)),
-        "reviews_per_month": Column(pa.Float64, Check.ge(0), nullable=True),
-        "calculated_host_listings_count": Column(pa.Int64, Check.ge(0)),
-        "last_review": Column(pa.DateTime, nullable=True),
-    },
-    coerce=True,
-    strict=False,
 )
 
-REVIEWS_SCHEMA = DataFrameSchema(
-    {
-        "listing_id": Column(pa.Int64, Check.gt(0)),
-        "date": Column(pa.DateTime),
-    },
-    coerce=True,
-    strict=False,
+# Bound how many failing rows each check (and the whole report) materializes.
+MAX_FAILURE_CASES_PER_CHECK = 100
+MAX_REPORTED_FAILURE_CASES = 500
+REPORT_WRITE_BUFFER = 1 << 20
+VALIDATION_FINGERPRINT_ATTR = "validation_fingerprint"
+_UTC = timezone.utc
+ARROW_STRING = pd.ArrowDtype(pyarrow_lib.string())
+
+
+def _bounds_mask(values: np.ndarray, low: float, high: float, include_low: bool) -> np.ndarray:
+    above = values >= low if include_low else values > low
+    return above & (values <= high)
+
+
+def _build_schema_registry(column_cls: Any, schema_cls: Any, pandas_backend: bool) -> Dict[str, Any]:
+    """
+    Declare the dataset schemas once for either the pandas or the Polars pandera backend.
+
+    On pandas, ``room_type`` is coerced to a categorical over ``ROOM_TYPES``, so unknown values
+    fail the coercion instead of a row-wise ``isin``. Polars casts every column in one
+    expression, so a single unknown room type would abort all coercions there; that backend
+    keeps ``isin``.
+    """
+
+    cap = MAX_FAILURE_CASES_PER_CHECK
+    if pandas_backend:
+        room_type = column_cls(pd.CategoricalDtype(ROOM_TYPES), nullable=False)
+    else:
+        room_type = column_cls(pa.String, Check.isin(list(ROOM_TYPES), n_failure_cases=cap), nullable=False)
+
+    listings_schema = schema_cls(
+        {
+            "id": column_cls(pa.Int64, Check.gt(0, n_failure_cases=cap), nullable=False, unique=True),
+            "name": column_cls(pa.String, nullable=False),
+            "host_id": column_cls(pa.Int64, Check.gt(0, n_failure_cases=cap), nullable=False),
+            "host_name": column_cls(pa.String, nullable=True),
+            "neighbourhood": column_cls(pa.String, nullable=True),
+            "room_type": room_type,
+            "price": column_cls(pa.Float64, Check.ge(0, n_failure_cases=cap)),
+            "minimum_nights": column_cls(pa.Int64, Check.ge(1, n_failure_cases=cap)),
+            "availability_365": column_cls(pa.Int64, Check.in_range(0, 365, n_failure_cases=cap)),
+            "number_of_reviews": column_cls(pa.Int64, Check.ge(0, n_failure_cases=cap)),
+            "reviews_per_month": column_cls(pa.Float64, Check.ge(0, n_failure_cases=cap), nullable=True),
+            "calculated_host_listings_count": column_cls(pa.Int64, Check.ge(0, n_failure_cases=cap)),
+            "last_review": column_cls(pa.DateTime, nullable=True),
+        },
+        coerce=True,
+        strict=False,
+    )
+    reviews_schema = schema_cls(
+        {
+            "listing_id": column_cls(pa.Int64, Check.gt(0, n_failure_cases=cap)),
+            "date": column_cls(pa.DateTime),
+        },
+        coerce=True,
+        strict=False,
+    )
+    return {
+        "listings": listings_schema,
+        "reviews": reviews_schema,
+    }
+
+
+SCHEMA_REGISTRY = _build_schema_registry(Column, DataFrameSchema, pandas_backend=True)
+LISTINGS_SCHEMA = SCHEMA_REGISTRY["listings"]
+REVIEWS_SCHEMA = SCHEMA_REGISTRY["reviews"]
+POLARS_SCHEMA_REGISTRY = (
+    _build_schema_registry(pa_polars.Column, pa_polars.DataFrameSchema, pandas_backend=False)
+    if pa_polars is not None
+    else {}
 )
 
-SCHEMA_REGISTRY = {
-    "listings": LISTINGS_SCHEMA,
-    "reviews": REVIEWS_SCHEMA,
-}
+
+BOUNDS_CHECKS = {"greater_than", "greater_than_or_equal_to", "in_range"}
+
+
+def _column_dtype_ok(series: pd.Series, column: Column, has_nulls: bool) -> bool:
+    """Whether ``series`` already satisfies the column dtype, so coercion cannot fail."""
+
+    target = str(column.dtype)
+    if target == "int64":
+        # numpy int64 cannot hold nulls, so coercing a nullable integer column with nulls fails.
+        return pd.api.types.is_integer_dtype(series) and not has_nulls
+    if target == "float64":
+        return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+    if target.startswith("datetime64"):
+        if isinstance(series.dtype, pd.ArrowDtype):
+            # ``.dt.tz`` is not implemented for Arrow dates, so inspect the Arrow type directly.
+            arrow_type = series.dtype.pyarrow_dtype
+            return pyarrow_lib.types.is_date(arrow_type) or (
+                pyarrow_lib.types.is_timestamp(arrow_type) and arrow_type.tz is None
+            )
+        return pd.api.types.is_datetime64_any_dtype(series) and series.dt.tz is None
+    if target == "category":
+        # Compare the few distinct values against a hashed category set instead of probing every row.
+        return frozenset(series.dropna().unique()) <= frozenset(column.dtype.type.categories)
+    if target.startswith("string") or target == "str":
+        return pd.api.types.is_string_dtype(series)
+    return False
+
+
+def _checks_pass(series: pd.Series, column: Column) -> bool:
+    values: Optional[np.ndarray] = None
+    for check in column.checks:
+        stats = check.statistics or {}
+        if check.name not in BOUNDS_CHECKS or "min_value" not in stats or not stats.get("include_max", True):
+            return False
+        if values is None:
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+        low = float(stats["min_value"])
+        high = float(stats.get("max_value", np.inf))
+        include_low = bool(stats.get("include_min", check.name != "greater_than"))
+        mask = _bounds_mask(values, low, high, include_low)
+        # Checks ignore nulls, exactly like pandera's ``ignore_na`` default.
+        if not (mask | np.isnan(values)).all():
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _schema_profile(name: str) -> Tuple[List[str], Dict[str, Any]]:
+    """Non-nullable column names and exact expected dtypes of a pandas schema, derived once."""
+
+    columns = SCHEMA_REGISTRY[name].columns
+    nonnull_columns = [column_name for column_name, column in columns.items() if not column.nullable]
+    expected_dtypes = {column_name: column.dtype.type for column_name, column in columns.items()}
+    return nonnull_columns, expected_dtypes
+
+
+def _fast_prevalidate(name: str, dataframe: pd.DataFrame) -> bool:
+    """
+    Cheaply prove that ``dataframe`` satisfies its pandas schema.
+
+    Returns ``True`` only when every column is present, already has a compatible dtype,
+    respects nullability/uniqueness and passes its bounds checks. Any unsupported check,
+    dtype or violation returns ``False`` so pandera runs and reports the failure cases.
+    """
+
+    schema = SCHEMA_REGISTRY.get(name)
+    if schema is None or schema.checks or not set(schema.columns).issubset(dataframe.columns):
+        return False
+    nonnull_columns, expected_dtypes = _schema_profile(name)
+    # A single vectorised null scan over every non-nullable column before any per-column work.
+    if dataframe[nonnull_columns].isna().to_numpy().any():
+        return False
+    for column_name, column in schema.columns.items():
+        series = dataframe[column_name]
+        # An exact dtype match needs no coercion; otherwise prove coercion cannot fail.
+        if series.dtype != expected_dtypes[column_name]:
+            has_nulls = column.nullable and bool(series.isna().any())
+            if not _column_dtype_ok(series, column, has_nulls):
+                return False
+        if column.unique and not series.is_unique:
+            return False
+        if not _checks_pass(series, column):
+            return False
+    return True
 
 
 @dataclass
@@ -67,27 +210,213 @@ class DatasetValidationResult:
     error_details: List[Dict[str, object]]
 
 
+def _to_polars(dataframe: pd.DataFrame) -> Optional["pl.DataFrame"]:
+    try:
+        return pl.from_pandas(dataframe)
+    except (pyarrow_lib.ArrowInvalid, pyarrow_lib.ArrowTypeError):
+        # Mixed-type object columns have no Arrow/Polars representation.
+        return None
+
+
+def _to_arrow_backed(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Move object columns holding only strings onto Arrow storage, as extraction already does.
+
+    Only worth it on the way to Polars, which then shares the Arrow buffers; pandera's
+    pandas backend coerces ``pa.String`` columns back to ``str`` anyway.
+    """
+
+    string_columns = {
+        column_name: ARROW_STRING
+        for column_name, dtype in dataframe.dtypes.items()
+        if dtype == object and pd.api.types.infer_dtype(dataframe[column_name], skipna=True) == "string"
+    }
+    if not string_columns:
+        return dataframe
+    return dataframe.astype(string_columns, copy=False)
+
+
+def _parses_text(schema: DataFrameSchema, dataframe: pd.DataFrame) -> bool:
+    """
+    Whether a numeric or datetime schema column arrives as text (e.g. plain ``pd.read_csv``).
+
+    pandas coerces such strings (``"2024-01-03"``, ``"42"``); Polars refuses to cast text to
+    temporal or numeric types and would report every row, so these frames stay on pandas.
+    """
+
+    for column_name, column in schema.columns.items():
+        target = str(column.dtype)
+        if column_name not in dataframe.columns or target in ("str", "category") or target.startswith("string"):
+            continue
+        if pd.api.types.is_string_dtype(dataframe[column_name]):
+            return True
+    return False
+
+
+def _run_schema(name: str, schema: DataFrameSchema, dataframe: pd.DataFrame) -> None:
+    polars_schema = POLARS_SCHEMA_REGISTRY.get(name)
+    if polars_schema is not None and _parses_text(schema, dataframe):
+        polars_schema = None
+    polars_frame = _to_polars(_to_arrow_backed(dataframe)) if polars_schema is not None else None
+    if polars_frame is not None:
+        # Eager frames get schema- and data-level checks; a LazyFrame would only check the schema.
+        try:
+            polars_schema.validate(polars_frame, lazy=True)
+            return
+        except pl.exceptions.PolarsError as exc:
+            # e.g. coercing a missing column raises instead of reporting a failure case.
+            LOGGER.warning("Polars validation errored for `%s` (%s); using the pandas backend.", name, exc)
+    schema.validate(dataframe, lazy=True)
+
+
+def _restore_polars_failure_cases(
+    failure_cases: pd.DataFrame,
+    schema: DataFrameSchema,
+    dataframe: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Map Polars failure cases back onto ``dataframe`` so reports match the pandas backend.
+
+    Polars stringifies every failing value and reports row positions; row-level cases get
+    the typed (schema-coerced) value and the index label of the validated frame instead.
+    """
+
+    restored = failure_cases.astype({"failure_case": object, "index": object})
+    positions = pd.to_numeric(failure_cases["index"], errors="coerce")
+    row_level = positions.notna() & failure_cases["column"].isin(dataframe.columns)
+    for column_name, group in restored[row_level].groupby("column"):
+        values = dataframe[column_name].iloc[positions[group.index].astype("int64").to_numpy()]
+        column = schema.columns.get(column_name)
+        # Categorical failures are values outside the categories; report them verbatim.
+        if column is not None and not isinstance(column.dtype.type, pd.CategoricalDtype):
+            try:
+                values = column.dtype.try_coerce(values)
+            except ParserError:
+                # Values that failed coercion are reported as they were received.
+                pass
+        restored.loc[group.index, "failure_case"] = pd.Series(values.tolist(), index=group.index, dtype=object)
+    labels = dataframe.index[positions[row_level].astype("int64").to_numpy()]
+    restored.loc[row_level, "index"] = pd.Series(labels.tolist(), index=restored.index[row_level], dtype=object)
+    return restored
+
+
+def _failure_records(
+    name: str,
+    failure_cases: Any,
+    schema: DataFrameSchema,
+    dataframe: pd.DataFrame,
+) -> List[Dict[str, object]]:
+    from_polars = pl is not None and isinstance(failure_cases, pl.DataFrame)
+    if from_polars:
+        failure_cases = failure_cases.to_pandas()
+    # Null and uniqueness failures are not capped per check, so collapse repeats here.
+    capped = failure_cases.drop_duplicates(subset=["column", "failure_case"]).head(MAX_REPORTED_FAILURE_CASES)
+    if from_polars:
+        capped = _restore_polars_failure_cases(capped.reset_index(drop=True), schema, dataframe)
+    columns = (*capped.columns, "dataset")
+    return [dict(zip(columns, (*row, name))) for row in capped.itertuples(index=False, name=None)]
+
+
+def _fingerprint(dataframe: pd.DataFrame) -> Tuple[Any, ...]:
+    """Shape, column names and a vectorised content hash of ``dataframe`` (index included)."""
+
+    row_hashes = pd.util.hash_pandas_object(dataframe, index=True).to_numpy()
+    return (*dataframe.shape, *dataframe.columns, int(row_hashes.sum(dtype=np.uint64)))
+
+
+def _mark_validated(dataframe: pd.DataFrame, schema: DataFrameSchema) -> None:
+    dataframe.pandera.add_schema(schema)
+    dataframe.attrs[VALIDATION_FINGERPRINT_ATTR] = _fingerprint(dataframe)
+
+
 def _validate_dataset(name: str, dataframe: pd.DataFrame) -> DatasetValidationResult:
     schema = SCHEMA_REGISTRY.get(name)
     if schema is None:
         LOGGER.warning("No schema registered for dataset `%s`. Skipping validation.", name)
         return DatasetValidationResult(name=name, passed=True, row_count=len(dataframe), error_details=[])
 
+    # Frames that already passed carry their schema and a content fingerprint; the schema tag
+    # survives in-place edits, so the fingerprint must still match for the checks to be skipped.
+    if (
+        dataframe.pandera.schema is schema
+        and dataframe.attrs.get(VALIDATION_FINGERPRINT_ATTR) == _fingerprint(dataframe)
+    ):
+        LOGGER.info("Dataset `%s` already validated; skipping checks (%s rows)", name, len(dataframe))
+        return DatasetValidationResult(name=name, passed=True, row_count=len(dataframe), error_details=[])
+
+    if _fast_prevalidate(name, dataframe):
+        _mark_validated(dataframe, schema)
+        LOGGER.info("Validation passed for dataset `%s` (%s rows, fast path)", name, len(dataframe))
+        return DatasetValidationResult(name=name, passed=True, row_count=len(dataframe), error_details=[])
+
     try:
-        schema.validate(dataframe, lazy=True)
+        _run_schema(name, schema, dataframe)
+        _mark_validated(dataframe, schema)
         LOGGER.info("Validation passed for dataset `%s` (%s rows)", name, len(dataframe))
         return DatasetValidationResult(name=name, passed=True, row_count=len(dataframe), error_details=[])
     except SchemaErrors as err:
-        failure_cases = err.failure_cases.copy()
-        failure_cases["dataset"] = name
-        details = failure_cases.to_dict(orient="records")
+        details = _failure_records(name, err.failure_cases, schema, dataframe)
         LOGGER.error("Validation failed for dataset `%s` with %s issues", name, len(details))
         return DatasetValidationResult(name=name, passed=False, row_count=len(dataframe), error_details=details)
 
 
+def _json_default(value: Any) -> Any:
+    # Failure cases can hold pandas/NumPy scalars (pd.NA, np.int64, Timestamp) json cannot encode.
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(value, default=_json_default).encode("utf-8")
+
+
+def _iter_report_chunks(payload: Dict[str, object]) -> Iterator[bytes]:
+    """
+    Yield the report JSON piece by piece: one line per top-level field, dataset and issue.
+
+    Only the encoding is incremental. ``payload`` (issues included) is already in memory because
+    ``validate_dataframes`` returns it, and each dataset's issues are capped by ``MAX_REPORTED_FAILURE_CASES``.
+    """
+
+    fields = [b"  " + _dumps(key) + b": " + _dumps(value) for key, value in payload.items() if key != "datasets"]
+    yield b"{\n" + b",\n".join(fields) + b',\n  "datasets": ['
+    for index, dataset in enumerate(payload.get("datasets", [])):
+        header = {key: value for key, value in dataset.items() if key != "issues"}
+        # Reopen the encoded header object so the issues array can be streamed into it.
+        yield (b"," if index else b"") + b"\n    " + _dumps(header)[:-1] + b', "issues": ['
+        for issue_index, issue in enumerate(dataset.get("issues", [])):
+            yield (b"," if issue_index else b"") + b"\n      " + _dumps(issue)
+        yield b"\n    ]}"
+    yield b"\n  ]\n}\n"
+
+
+@lru_cache(maxsize=None)
+def _prepare_report_dir(report_path: str) -> Path:
+    """Resolve ``report_path`` and create its directory once per process."""
+
+    path = Path(report_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def _write_report(report_path: Path, payload: Dict[str, object]) -> None:
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    try:
+        handle = report_path.open("wb", buffering=REPORT_WRITE_BUFFER)
+    except FileNotFoundError:
+        # The directory was created once per process; recreate it if it was removed since.
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = report_path.open("wb", buffering=REPORT_WRITE_BUFFER)
+    with handle:
+        handle.writelines(_iter_report_chunks(payload))
     LOGGER.info("Data quality report stored at %s", report_path)
 
 
@@ -106,7 +435,14 @@ def validate_dataframes(
         Path to write the data quality report. If None, no file is written.
     """
 
-    results = [_validate_dataset(name, df) for name, df in datasets.items()]
+    # One stamp for the whole report, taken when validation starts.
+    generated_at = datetime.now(_UTC).isoformat(timespec="seconds")
+    results: List[DatasetValidationResult] = []
+    if datasets:
+        # Datasets are independent and the heavy checks run in native kernels, so overlap them.
+        workers = min(len(datasets), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_dataset, datasets.keys(), datasets.values()))
     summary = {
         "validated_datasets": len(results),
         "valid_datasets": sum(1 for result in results if result.passed),
@@ -114,7 +450,7 @@ def validate_dataframes(
     }
 
     payload = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at,
         "summary": summary,
         "datasets": [
             {
@@ -128,7 +464,7 @@ def validate_dataframes(
     }
 
     if report_path:
-        _write_report(Path(report_path), payload)
+        _write_report(_prepare_report_dir(str(report_path)), payload)
 
     return payload
 
@@ -9,24 +9,35 @@ be reused both by local scripts and by orchestrated jobs (Airflow, Prefect, etc.
 
 from __future__ import annotations
 
+import io
 import logging
 import os
 import re
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence, Union
 
 import yaml
 from dotenv import load_dotenv
-from sqlalchemy import text
-from sqlalchemy.engine import Connection, Engine, Result, create_engine
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine, Result, create_engine, make_url
+
+try:  # libyaml's C parser when PyYAML was built with it; same safe semantics.
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YAML_LOADER
 
 load_dotenv()
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_CONFIG_PATH = Path(os.getenv("PIPELINE_CONFIG", "src/config/config.yaml"))
 ENV_PATTERN = re.compile(r"\$\{([^}:]+)(:-([^}]+))?\}")
+COPY_NULL = "\\N"
+POOL_SIZE = 8
+POOL_MAX_OVERFLOW = 16
+POOL_RECYCLE_SECONDS = 1800
 
 
 @dataclass
@@ -38,12 +49,13 @@ class DatabaseConfig:
     staging_schema: Optional[str] = None
     load_batch_size: int = 5000
     echo: bool = False
+    bulk_loader: str = "copy"
 
 
 def _resolve_env_in_value(value: Any) -> Any:
     """Replace ${VAR:-default} style placeholders with environment values."""
 
-    if not isinstance(value, str):
+    if not isinstance(value, str) or "${" not in value:
         return value
 
     def replacer(match: re.Match[str]) -> str:
@@ -54,12 +66,28 @@ def _resolve_env_in_value(value: Any) -> Any:
     return ENV_PATTERN.sub(replacer, value)
 
 
+def _copy_container(data: Union[Dict[Any, Any], List[Any]]) -> Union[Dict[Any, Any], List[Any]]:
+    return dict(data) if isinstance(data, dict) else list(data)
+
+
 def _resolve_env_in_structure(data: Any) -> Any:
-    if isinstance(data, dict):
-        return {k: _resolve_env_in_structure(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return [_resolve_env_in_structure(item) for item in data]
-    return _resolve_env_in_value(data)
+    """Resolve placeholders in every string leaf, walking nested containers with an explicit stack."""
+
+    if not isinstance(data, (dict, list)):
+        return _resolve_env_in_value(data)
+
+    root = _copy_container(data)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for key in node.keys() if isinstance(node, dict) else range(len(node)):
+            value = node[key]
+            if isinstance(value, (dict, list)):
+                node[key] = _copy_container(value)
+                stack.append(node[key])
+            elif isinstance(value, str):
+                node[key] = _resolve_env_in_value(value)
+    return root
 
 
 def load_pipeline_config(config_path: Optional[str] = None) -> Dict[str, Any]:
@@ -76,12 +104,24 @@ def load_pipeline_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    with path.open("r", encoding="utf-8") as cfg:
-        raw = yaml.safe_load(cfg) or {}
-
+    # Parsing is cached per file version; env expansion runs on every call so environment
+    # changes are honoured, and it copies every container so the cached tree stays pristine.
+    raw = _read_yaml(str(path.resolve()), path.stat().st_mtime_ns)
     return _resolve_env_in_structure(raw)
 
 
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as cfg:
+        return yaml.load(cfg, Loader=YAML_LOADER) or {}
+
+
+def clear_config_cache() -> None:
+    """Drop parsed configuration files cached by ``load_pipeline_config``."""
+
+    _read_yaml.cache_clear()
+
+
 def build_database_config(config: Optional[Dict[str, Any]] = None) -> DatabaseConfig:
     """Create a ``DatabaseConfig`` dataclass from loaded configuration."""
 
@@ -93,9 +133,21 @@ def build_database_config(config: Optional[Dict[str, Any]] = None) -> DatabaseCo
         staging_schema=warehouse_cfg.get("staging_schema"),
         load_batch_size=int(warehouse_cfg.get("load_batch_size", 5000)),
         echo=bool(warehouse_cfg.get("echo", False)),
+        bulk_loader=str(warehouse_cfg.get("bulk_loader", "copy")).lower(),
     )
 
 
+@lru_cache(maxsize=None)
+def _make_engine(uri: str, echo: bool) -> Engine:
+    """Create one engine per warehouse URI so every ``DBConnector`` shares its connection pool."""
+
+    options: Dict[str, Any] = {"future": True, "echo": echo, "pool_pre_ping": True}
+    if make_url(uri).get_backend_name() != "sqlite":
+        # SQLite's singleton/null pools reject QueuePool sizing arguments.
+        options.update(pool_size=POOL_SIZE, max_overflow=POOL_MAX_OVERFLOW, pool_recycle=POOL_RECYCLE_SECONDS)
+    return create_engine(uri, **options)
+
+
 class DBConnector:
     """
     High-level helper that wraps SQLAlchemy engine creation and basic operations.
@@ -116,12 +168,7 @@ class DBConnector:
         self.db_config = build_database_config(cfg)
         if not self.db_config.uri:
             raise ValueError("Warehouse URI is missing in config.yaml or environment variables.")
-        self.engine: Engine = create_engine(
-            self.db_config.uri,
-            future=True,
-            echo=self.db_config.echo,
-            pool_pre_ping=True,
-        )
+        self.engine: Engine = _make_engine(self.db_config.uri, self.db_config.echo)
         self.logger.debug(
             "Initialized DB engine for %s (schema=%s)",
             self.db_config.uri,
@@ -138,12 +185,165 @@ class DBConnector:
         finally:
             connection.close()
 
-    def run_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> Result:
-        """Execute a query using SQLAlchemy ``text`` bindings and return the Result."""
+    @contextmanager
+    def raw_connection(self) -> Generator[Any, None, None]:
+        """Yield a pooled DBAPI connection (e.g. for ``COPY``), returning it to the pool on exit."""
+
+        connection = self.engine.raw_connection()
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def raw_transaction(self, connection: Optional[Any] = None) -> Generator[Any, None, None]:
+        """
+        Yield a DBAPI cursor whose statements commit (or roll back) together.
+
+        Reuses ``connection`` when the caller holds one for a whole session,
+        otherwise borrows a pooled connection for the duration of the transaction.
+        """
+
+        if connection is None:
+            with self.raw_connection() as owned_connection:
+                with self.raw_transaction(owned_connection) as cursor:
+                    yield cursor
+            return
+        cursor = connection.cursor()
+        try:
+            yield cursor
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def adbc_cursor(self) -> Generator[Any, None, None]:
+        """
+        Yield an ADBC PostgreSQL cursor for Arrow-native ingestion, committing on success.
+
+        Requires the optional ``adbc-driver-postgresql`` package. Arrow column types must
+        match the target table exactly because ADBC streams them with binary ``COPY``;
+        ``load.append_fact_batches`` casts each batch to the table's schema first.
+        """
+
+        try:
+            from adbc_driver_postgresql import dbapi as adbc_dbapi  # type: ignore
+        except ImportError as exc:
+            raise ImportError("adbc-driver-postgresql is required for adbc_cursor") from exc
+
+        libpq_uri = make_url(self.db_config.uri).set(drivername="postgresql").render_as_string(hide_password=False)
+        connection = adbc_dbapi.connect(libpq_uri)
+        try:
+            with connection.cursor() as cursor:
+                yield cursor
+            connection.commit()
+        finally:
+            connection.close()
+
+    def run_query(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        conn: Optional[Connection] = None,
+    ) -> Result:
+        """
+        Execute a query using SQLAlchemy ``text`` bindings and return the Result.
+
+        Parameters
+        ----------
+        query : str
+            SQL text with ``:name`` bind parameters.
+        params : Optional[Dict[str, Any]]
+            Bind parameter values.
+        conn : Optional[Connection]
+            Open connection to reuse across a batch of queries; the caller owns its
+            transaction. A pooled connection is checked out per call when omitted.
+        """
 
         self.logger.debug("Executing query: %s | params=%s", query, params)
-        with self.connect() as conn:
+        if conn is not None:
             return conn.execute(text(query), params or {})
+        with self.connect() as connection:
+            return connection.execute(text(query), params or {})
+
+    @property
+    def supports_copy(self) -> bool:
+        """Whether the warehouse accepts ``COPY FROM STDIN`` bulk loads (PostgreSQL)."""
+
+        return self.engine.dialect.name == "postgresql"
+
+    def copy_dataframe(
+        self,
+        dataframe,
+        table_name: str,
+        schema: Optional[str] = None,
+        setup_statements: Sequence[str] = (),
+        connection: Optional[Any] = None,
+    ) -> None:
+        """
+        Stream a DataFrame into an existing PostgreSQL table with ``COPY FROM STDIN``.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            Data to load; its columns name the target columns.
+        table_name : str
+            Destination table name.
+        schema : Optional[str]
+            Schema override (defaults to warehouse.schema).
+        setup_statements : Sequence[str]
+            Statements run before the COPY in the same transaction (DDL, ``TRUNCATE``, ``SET LOCAL``).
+        connection : Optional[Any]
+            Open DBAPI connection to reuse; a pooled one is borrowed when omitted.
+        """
+
+        self.copy_dataframes([dataframe], table_name, schema, setup_statements, connection)
+
+    def copy_dataframes(
+        self,
+        dataframes: Iterable[Any],
+        table_name: str,
+        schema: Optional[str] = None,
+        setup_statements: Sequence[str] = (),
+        connection: Optional[Any] = None,
+    ) -> None:
+        """
+        Stream several DataFrames into one PostgreSQL table with one ``COPY`` each and a single commit.
+
+        Parameters
+        ----------
+        dataframes : Iterable[pandas.DataFrame]
+            Batches to load, consumed lazily; their columns name the target columns.
+        table_name : str
+            Destination table name.
+        schema : Optional[str]
+            Schema override (defaults to warehouse.schema).
+        setup_statements : Sequence[str]
+            Statements run before the first COPY in the same transaction.
+        connection : Optional[Any]
+            Open DBAPI connection to reuse; a pooled one is borrowed when omitted.
+        """
+
+        target_schema = schema or self.db_config.schema
+        with self.raw_transaction(connection) as cursor:
+            for statement in setup_statements:
+                cursor.execute(statement)
+            for dataframe in dataframes:
+                buffer = io.StringIO()
+                dataframe.to_csv(buffer, index=False, header=False, na_rep=COPY_NULL)
+                buffer.seek(0)
+                column_list = ", ".join(dataframe.columns)
+                copy_sql = (
+                    f"COPY {target_schema}.{table_name} ({column_list}) "
+                    f"FROM STDIN WITH (FORMAT CSV, NULL '{COPY_NULL}')"
+                )
+                self.logger.info(
+                    "Copying dataframe into %s.%s (%s rows)", target_schema, table_name, len(dataframe)
+                )
+                cursor.copy_expert(copy_sql, buffer)
 
     def load_dataframe(
         self,
@@ -155,7 +355,10 @@ class DBConnector:
         method: str = "multi",
     ) -> None:
         """
-        Persist a pandas DataFrame into the target warehouse using ``to_sql``.
+        Persist a pandas DataFrame into the target warehouse.
+
+        PostgreSQL rows are streamed with ``COPY`` (``to_sql`` only creates or replaces the
+        table definition); other dialects insert through ``to_sql``.
 
         Parameters
         ----------
@@ -170,7 +373,7 @@ class DBConnector:
         chunksize : Optional[int]
             Optional chunk size for batch inserts.
         method : str
-            Pandas insert method (multi for efficient batched inserts).
+            Pandas insert method for non-PostgreSQL dialects (multi for batched inserts).
         """
 
         try:
@@ -182,6 +385,18 @@ class DBConnector:
             raise TypeError("Dataframe argument must be a pandas DataFrame.")
 
         target_schema = schema or self.db_config.schema
+        if self.supports_copy:
+            if if_exists != "append" or not inspect(self.engine).has_table(table_name, schema=target_schema):
+                dataframe.head(0).to_sql(
+                    table_name,
+                    con=self.engine,
+                    schema=target_schema,
+                    if_exists=if_exists,
+                    index=False,
+                )
+            self.copy_dataframe(dataframe, table_name, schema=target_schema)
+            return
+
         self.logger.info(
             "Loading dataframe into %s.%s (%s rows)",
             target_schema,
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
+import threading
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -14,12 +19,80 @@ load_dotenv()
 LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 DEFAULT_LOG_FILE = "pipeline_execution.log"
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
 
+_FORMATTER = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+# Guards listener start/stop when loggers are used from worker threads.
+_LOG_QUEUE_LOCK = threading.Lock()
+_LISTENERS: Dict[Path, QueueListener] = {}
 
+
+@lru_cache(maxsize=None)
 def _ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=None)
+def _log_queue(log_file: Path) -> "queue.Queue[logging.LogRecord]":
+    return queue.Queue(-1)
+
+
+@lru_cache(maxsize=None)
+def _log_handlers(log_file: Path) -> Tuple[logging.Handler, ...]:
+    """Console + rotating file handlers (created once per log file) that perform all log I/O."""
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(_FORMATTER)
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(_FORMATTER)
+    return stream_handler, file_handler
+
+
+def _ensure_listener(log_file: Path) -> None:
+    with _LOG_QUEUE_LOCK:
+        if log_file not in _LISTENERS:
+            listener = QueueListener(_log_queue(log_file), *_log_handlers(log_file))
+            listener.start()
+            _LISTENERS[log_file] = listener
+
+
+class _ListenerQueueHandler(QueueHandler):
+    """Queue records for the background listener of ``log_file``, (re)starting it on demand."""
+
+    def __init__(self, log_file: Path) -> None:
+        super().__init__(_log_queue(log_file))
+        self.log_file = log_file
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.log_file not in _LISTENERS:
+            _ensure_listener(self.log_file)
+        super().enqueue(record)
+
+
+def shutdown_logging() -> None:
+    """
+    Write every queued record and stop the background listeners.
+
+    Runs at interpreter exit, but Airflow's forked task runner leaves through ``os._exit``,
+    which skips ``atexit``; entrypoints therefore call it before returning. A record logged
+    afterwards starts its listener again.
+    """
+
+    with _LOG_QUEUE_LOCK:
+        for listener in _LISTENERS.values():
+            listener.stop()
+        _LISTENERS.clear()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(
     name: str,
     log_level: Optional[str] = None,
@@ -27,7 +100,7 @@ def get_logger(
     propagate: bool = False,
 ) -> logging.Logger:
     """
-    Return a logger configured with console + file handlers.
+    Return a logger whose console + rotating file output is written by a background listener.
 
     Parameters
     ----------
@@ -52,17 +125,9 @@ def get_logger(
     logger.propagate = propagate
 
     if not logger.handlers:
-        formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
-        stream_handler.setLevel(level)
-
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(level)
-
-        logger.addHandler(stream_handler)
-        logger.addHandler(file_handler)
+        with _LOG_QUEUE_LOCK:
+            queue_handler = _ListenerQueueHandler(log_file)
+        queue_handler.setLevel(level)
+        logger.addHandler(queue_handler)
 
     return logger
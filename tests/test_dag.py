@@ -0,0 +1,41 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("airflow")
+
+DAG_FILE = Path(__file__).resolve().parents[1] / "dags" / "etl_pipeline.py"
+
+
+def _load_dag():
+    spec = importlib.util.spec_from_file_location("etl_pipeline", DAG_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.dag
+
+
+def test_dag_orders_loads_by_foreign_keys_and_serializes_snapshots():
+    dag = _load_dag()
+
+    def upstream(task_id):
+        return dag.get_task(task_id).upstream_task_ids
+
+    assert upstream("extract") == set()
+    assert upstream("transform") == {"extract"}
+    assert upstream("load_dim_host") == {"transform"}
+    # Snapshot loads TRUNCATE ... CASCADE, so they run one after another.
+    assert upstream("load_dim_neighborhood") == {"transform"}
+    assert upstream("load_dim_property_type") == {"transform", "load_dim_neighborhood"}
+    assert upstream("load_dim_date") == {"transform", "load_dim_property_type"}
+    assert upstream("load_dim_listing") == {
+        "transform",
+        "load_dim_host",
+        "load_dim_property_type",
+        "load_dim_neighborhood",
+    }
+    dimension_tasks = {
+        f"load_{table}" for table in ["dim_host", "dim_listing", "dim_neighborhood", "dim_property_type", "dim_date"]
+    }
+    for fact_task in ["load_fact_listing_daily_metrics", "load_fact_review"]:
+        assert upstream(fact_task) == dimension_tasks
@@ -0,0 +1,27 @@
+import os
+
+from src.utils.db_connector import clear_config_cache, load_pipeline_config
+
+
+def _write_config(path, output_dir, mtime_ns):
+    path.write_text(f"paths:\n  output_dir: {output_dir}\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_changed_config_is_reloaded_and_clear_config_cache_forces_a_reparse(tmp_path):
+    clear_config_cache()
+    config_path = tmp_path / "config.yaml"
+    mtime_ns = 1_700_000_000_000_000_000
+
+    _write_config(config_path, "first", mtime_ns)
+    assert load_pipeline_config(str(config_path))["paths"]["output_dir"] == "first"
+
+    # A new mtime means a new file version, so the cached parse is not reused.
+    _write_config(config_path, "second", mtime_ns + 1_000_000_000)
+    assert load_pipeline_config(str(config_path))["paths"]["output_dir"] == "second"
+
+    # Same mtime: served from the cache until it is cleared.
+    _write_config(config_path, "third", mtime_ns + 1_000_000_000)
+    assert load_pipeline_config(str(config_path))["paths"]["output_dir"] == "second"
+    clear_config_cache()
+    assert load_pipeline_config(str(config_path))["paths"]["output_dir"] == "third"
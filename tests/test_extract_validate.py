@@ -5,7 +5,7 @@ import pandas as pd
 import pytest
 import yaml
 
-from src.pipeline.extract import extract_sources
+from src.pipeline.extract import extract_sources, iter_source_chunks
 from src.pipeline.validate import validate_dataframes
 
 
@@ -53,6 +53,61 @@ def test_extract_sources_reads_all_configured_files(sample_config: Path):
     assert result.metadata["listings"]["row_count"] == 2
 
 
+def test_extract_sources_reuses_parquet_cache(sample_config: Path):
+    first = extract_sources(config_path=str(sample_config))
+    second = extract_sources(config_path=str(sample_config))
+
+    assert first.metadata["listings"]["cache_hit"] is False
+    assert second.metadata["listings"]["cache_hit"] is True
+    assert Path(second.metadata["listings"]["cache_path"]).exists()
+    pd.testing.assert_frame_equal(first.dataframes["listings"], second.dataframes["listings"])
+
+
+def test_extract_sources_limit_slices_the_fully_parsed_source(sample_config: Path):
+    result = extract_sources(config_path=str(sample_config), limit=1)
+
+    assert len(result.dataframes["listings"]) == 1
+    assert result.metadata["listings"]["cache_hit"] is False
+    assert len(pd.read_parquet(result.metadata["listings"]["cache_path"])) == 2
+
+    chunks = list(iter_source_chunks("listings", config_path=str(sample_config), chunksize=1))
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+
+
+def test_cached_limited_and_chunked_reads_never_decode_the_whole_cache(sample_config: Path, monkeypatch):
+    extract_sources(config_path=str(sample_config))
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("the whole cached table should not be decoded")
+
+    monkeypatch.setattr("src.pipeline.extract.pq.read_table", _fail)
+    limited = extract_sources(config_path=str(sample_config), limit=1)
+    chunks = list(iter_source_chunks("reviews", config_path=str(sample_config), chunksize=1))
+
+    assert limited.metadata["listings"]["cache_hit"] is True
+    assert len(limited.dataframes["listings"]) == 1
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+
+
+def test_extract_handles_type_change_after_first_block(tmp_path: Path):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    rows = "".join(f"{i},{i}\n" for i in range(1, 300_001))
+    (raw_dir / "codes.csv").write_text(f"id,code\n{rows}300001,ABC\n", encoding="utf-8")
+    config_path = tmp_path / "config.yaml"
+    config = {"paths": {"raw_data_dir": str(raw_dir)}, "sources": {"codes": {"file": "codes.csv", "primary_key": "id"}}}
+    config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+
+    limited = extract_sources(config_path=str(config_path), limit=5).dataframes["codes"]
+    chunks = list(iter_source_chunks("codes", config_path=str(config_path), chunksize=100_000))
+    full = extract_sources(config_path=str(config_path)).dataframes["codes"]
+
+    assert len(limited) == 5
+    assert limited["code"].dtype == full["code"].dtype == chunks[0]["code"].dtype
+    assert sum(len(chunk) for chunk in chunks) == len(full) == 300_001
+    assert full["code"].iloc[-1] == "ABC"
+
+
 def test_validate_dataframes_writes_quality_report(tmp_path: Path, sample_config: Path):
     extraction = extract_sources(config_path=str(sample_config))
     report_path = tmp_path / "report.json"
@@ -65,3 +120,103 @@ def test_validate_dataframes_writes_quality_report(tmp_path: Path, sample_config
     report = json.loads(report_path.read_text(encoding="utf-8"))
     assert report["summary"]["valid_datasets"] == 2
     assert all(dataset["passed"] for dataset in report["datasets"])
+
+
+def test_validate_dataframes_recreates_a_removed_report_directory(tmp_path: Path, sample_config: Path):
+    extraction = extract_sources(config_path=str(sample_config))
+    report_path = tmp_path / "reports" / "report.json"
+
+    validate_dataframes(extraction.dataframes, report_path=str(report_path))
+    report_path.unlink()
+    report_path.parent.rmdir()
+    validate_dataframes(extraction.dataframes, report_path=str(report_path))
+
+    assert json.loads(report_path.read_text(encoding="utf-8"))["summary"]["valid_datasets"] == 2
+
+
+def test_validate_dataframes_reports_failure_cases(sample_config: Path):
+    extraction = extract_sources(config_path=str(sample_config))
+    listings = extraction.dataframes["listings"].copy()
+    listings["room_type"] = ["Entire home/apt", "Castle"]
+
+    payload = validate_dataframes({"listings": listings}, report_path=None)
+
+    assert payload["summary"]["invalid_datasets"] == 1
+    issues = payload["datasets"][0]["issues"]
+    assert {str(issue["failure_case"]) for issue in issues} == {"Castle"}
+
+
+def test_validate_dataframes_reports_typed_numeric_failure_cases(sample_config: Path):
+    extraction = extract_sources(config_path=str(sample_config))
+    listings = extraction.dataframes["listings"].copy()
+    listings["availability_365"] = [200, 400]
+    listings.index = [10, 11]
+
+    payload = validate_dataframes({"listings": listings}, report_path=None)
+
+    issues = payload["datasets"][0]["issues"]
+    assert [(issue["column"], issue["failure_case"], issue["index"]) for issue in issues] == [
+        ("availability_365", 400, 11)
+    ]
+    assert isinstance(issues[0]["failure_case"], int)
+
+
+def test_validate_dataframes_coerces_string_dates_in_plain_frames():
+    listings = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "name": ["Loft", "Studio"],
+            "host_id": [101, 202],
+            "host_name": ["Alice", "Bob"],
+            "neighbourhood": ["Downtown", "Midtown"],
+            "room_type": ["Entire home/apt", "Private room"],
+            "price": [150, 85],
+            "minimum_nights": [2, 1],
+            "availability_365": [200, 150],
+            "number_of_reviews": [42, 5],
+            "reviews_per_month": [1.2, 0.4],
+            "calculated_host_listings_count": [2, 1],
+            "last_review": ["2024-01-01", "2024-02-15"],
+        }
+    )
+    reviews = pd.DataFrame({"listing_id": [1, 2], "date": ["2024-01-03", "2024-02-20"]})
+
+    payload = validate_dataframes({"listings": listings, "reviews": reviews}, report_path=None)
+
+    assert payload["summary"]["valid_datasets"] == 2
+    assert all(not dataset["issues"] for dataset in payload["datasets"])
+
+
+def test_validate_dataframes_skips_frames_already_validated(sample_config: Path, monkeypatch):
+    extraction = extract_sources(config_path=str(sample_config))
+    validate_dataframes(extraction.dataframes, report_path=None)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("schema checks should not run again")
+
+    monkeypatch.setattr("src.pipeline.validate._run_schema", _fail)
+    payload = validate_dataframes(extraction.dataframes, report_path=None)
+    assert payload["summary"]["valid_datasets"] == 2
+
+
+def test_validate_dataframes_rechecks_frames_modified_after_validation(sample_config: Path):
+    extraction = extract_sources(config_path=str(sample_config))
+    validate_dataframes(extraction.dataframes, report_path=None)
+
+    listings = extraction.dataframes["listings"]
+    listings.loc[1, "availability_365"] = 400
+    payload = validate_dataframes({"listings": listings}, report_path=None)
+
+    assert payload["summary"]["invalid_datasets"] == 1
+    assert [issue["failure_case"] for issue in payload["datasets"][0]["issues"]] == [400]
+
+
+def test_validate_dataframes_fast_path_skips_pandera_for_clean_frames(sample_config: Path, monkeypatch):
+    extraction = extract_sources(config_path=str(sample_config))
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("clean frames should not reach pandera")
+
+    monkeypatch.setattr("src.pipeline.validate._run_schema", _fail)
+    payload = validate_dataframes(extraction.dataframes, report_path=None)
+    assert payload["summary"]["valid_datasets"] == 2
@@ -0,0 +1,40 @@
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.pipeline.load import ADBC_TYPNAME_KEY, _adbc_arrow_table, _iter_frames, _read_frame
+from src.utils.db_connector import COPY_NULL
+
+
+def test_adbc_arrow_table_matches_target_column_types():
+    # Shape of ``adbc_get_table_schema`` for INTEGER, NUMERIC(5,2) and TEXT columns.
+    target = pa.schema(
+        [
+            pa.field("review_key", pa.int64(), metadata={ADBC_TYPNAME_KEY: b"int8"}),
+            pa.field("date_key", pa.int32(), metadata={ADBC_TYPNAME_KEY: b"int4"}),
+            pa.field("sentiment_score", pa.string(), metadata={ADBC_TYPNAME_KEY: b"numeric"}),
+            pa.field("reviewer_name", pa.string(), metadata={ADBC_TYPNAME_KEY: b"text"}),
+        ]
+    )
+    facts = pd.DataFrame(
+        {"date_key": [20240101, 20240102], "sentiment_score": [0.25, None], "reviewer_name": ["Ana", None]}
+    )
+
+    table = _adbc_arrow_table(facts, target)
+
+    assert table.column_names == ["date_key", "sentiment_score", "reviewer_name"]
+    assert table.schema.field("date_key").type == pa.int32()
+    assert pa.types.is_decimal(table.schema.field("sentiment_score").type)
+    assert table.column("sentiment_score").to_pylist() == [Decimal("0.25"), None]
+
+
+def test_persisted_nullable_integers_stay_integral_for_copy(tmp_path):
+    path = tmp_path / "fact_review.parquet"
+    pq.write_table(pa.table({"date_key": pa.array([20240101, None], pa.int32())}), path)
+
+    # Float64 round-tripping would render `20240101.0`, which COPY rejects for INTEGER columns.
+    for frame in (_read_frame(path), next(_iter_frames(path))):
+        rendered = frame.to_csv(index=False, header=False, na_rep=COPY_NULL)
+        assert rendered.splitlines() == ["20240101", COPY_NULL]
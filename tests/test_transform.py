@@ -1,4 +1,7 @@
+from pathlib import Path
+
 import pandas as pd
+import pyarrow as pa
 
 from src.pipeline.extract import ExtractionResult
 from src.pipeline.transform import transform_datasets
@@ -57,3 +60,40 @@ def test_dim_date_captures_all_observed_dates():
     dim_date = transform_datasets(extraction).dimensions["dim_date"]
     assert set(dim_date["date_key"].tolist()) == {20240110, 20240220, 20240115}
     assert len(dim_date) == 3
+
+
+def test_transform_persists_parquet_intermediates(tmp_path: Path):
+    extraction = _build_sample_extraction()
+    in_memory = transform_datasets(extraction)
+    persisted = transform_datasets(extraction, output_dir=tmp_path)
+
+    fact_path = persisted.facts["fact_listing_daily_metrics"]
+    assert fact_path == tmp_path / "fact_listing_daily_metrics.parquet"
+    assert fact_path.exists()
+    round_trip = pd.read_parquet(fact_path)
+    assert round_trip["price_tier"].tolist() == in_memory.facts["fact_listing_daily_metrics"]["price_tier"].tolist()
+
+
+def test_transform_accepts_pretyped_price_and_flag_columns():
+    extraction = _build_sample_extraction()
+    typed = extraction.dataframes["listings"].assign(price=[120.0, -5.0], host_is_superhost=[True, False])
+    extraction.dataframes["listings"] = typed
+    result = transform_datasets(extraction)
+
+    host_dim = result.dimensions["dim_host"]
+    assert host_dim["host_is_superhost"].tolist() == [True, False]
+    assert result.facts["fact_listing_daily_metrics"]["price"].tolist() == [120.0, 0.0]
+
+
+def test_transform_handles_entirely_empty_low_cardinality_column(tmp_path: Path):
+    # Shape of data/listings.csv: an all-empty column (read by Arrow as ``null``) and no host flags.
+    extraction = _build_sample_extraction()
+    listings = extraction.dataframes["listings"].drop(columns=["host_is_superhost", "host_identity_verified"])
+    listings["neighbourhood_group"] = pd.Series([None, None], dtype=pd.ArrowDtype(pa.null()))
+    extraction.dataframes["listings"] = listings
+    result = transform_datasets(extraction, output_dir=tmp_path)
+
+    neighborhoods = pd.read_parquet(result.dimensions["dim_neighborhood"])
+    assert neighborhoods["city"].isna().all()
+    assert len(neighborhoods) == 2
+    assert pd.read_parquet(result.dimensions["dim_host"])["host_is_superhost"].tolist() == [False, False]